@@ -47,6 +47,10 @@ class CallbackManager:
         self._category_callbacks: defaultdict[str, list[tuple[CategoryCallback, Optional[str]]]] = defaultdict(list)
         self._bank_callbacks: defaultdict[ControlType, list[BankCallback]] = defaultdict(list)
 
+        # Flattened dispatch lists per (control_id, control_type, category, signal_type).
+        # Each entry is (callback, pass_control_id); cleared on any control callback change.
+        self._dispatch_cache: dict[tuple, tuple[tuple[Callable, bool], ...]] = {}
+
         self._lock = threading.RLock()
 
     # Registration methods
@@ -61,6 +65,7 @@ class CallbackManager:
         """
         with self._lock:
             self._global_callbacks.append((callback, signal_type))
+            self._dispatch_cache.clear()
             logger.debug(f"Registered global callback: {callback.__name__} (signal_type: {signal_type or 'all'})")
 
     def register_control(self, control_id: str, callback: ControlCallback, signal_type: Optional[str] = None) -> None:
@@ -74,6 +79,7 @@ class CallbackManager:
         """
         with self._lock:
             self._control_callbacks[control_id].append((callback, signal_type))
+            self._dispatch_cache.clear()
             logger.debug(
                 f"Registered callback for control '{control_id}': {callback.__name__} "
                 f"(signal_type: {signal_type or 'all'})",
@@ -95,6 +101,7 @@ class CallbackManager:
         """
         with self._lock:
             self._type_callbacks[control_type].append((callback, signal_type))
+            self._dispatch_cache.clear()
             logger.debug(
                 f"Registered callback for type '{control_type}': {callback.__name__} "
                 f"(signal_type: {signal_type or 'all'})",
@@ -111,6 +118,7 @@ class CallbackManager:
         """
         with self._lock:
             self._category_callbacks[category].append((callback, signal_type))
+            self._dispatch_cache.clear()
             logger.debug(
                 f"Registered callback for category '{category}': {callback.__name__} "
                 f"(signal_type: {signal_type or 'all'})",
@@ -145,6 +153,7 @@ class CallbackManager:
             for i, (cb, _) in enumerate(self._global_callbacks):
                 if cb == callback:
                     self._global_callbacks.pop(i)
+                    self._dispatch_cache.clear()
                     logger.debug(f"Unregistered global callback: {callback.__name__}")
                     return True
         return False
@@ -166,6 +175,7 @@ class CallbackManager:
                 for i, (cb, _) in enumerate(callbacks):
                     if cb == callback:
                         callbacks.pop(i)
+                        self._dispatch_cache.clear()
                         logger.debug(f"Unregistered callback for control '{control_id}': {callback.__name__}")
                         return True
         return False
@@ -187,6 +197,7 @@ class CallbackManager:
                 for i, (cb, _) in enumerate(callbacks):
                     if cb == callback:
                         callbacks.pop(i)
+                        self._dispatch_cache.clear()
                         logger.debug(f"Unregistered callback for type '{control_type}': {callback.__name__}")
                         return True
         return False
@@ -208,6 +219,7 @@ class CallbackManager:
                 for i, (cb, _) in enumerate(callbacks):
                     if cb == callback:
                         callbacks.pop(i)
+                        self._dispatch_cache.clear()
                         logger.debug(f"Unregistered callback for category '{category}': {callback.__name__}")
                         return True
         return False
@@ -261,35 +273,55 @@ class CallbackManager:
             signal_type: Signal type from MIDI translation (e.g., "note", "cc", "pc")
             category: Optional category of control (e.g., "transport", "pad")
         """
-        # Copy callback lists under lock (copy-before-dispatch pattern)
-        with self._lock:
-            control_cbs = self._control_callbacks[control_id].copy()
-            category_cbs = self._category_callbacks[category].copy() if category else []
-            type_cbs = self._type_callbacks[control_type].copy()
-            global_cbs = self._global_callbacks.copy()
+        key = (control_id, control_type, category, signal_type)
+        entries = self._dispatch_cache.get(key)
+        if entries is None:
+            # Build under lock so a concurrent registration can't be missed
+            with self._lock:
+                entries = self._build_dispatch(control_id, control_type, category, signal_type)
+                self._dispatch_cache[key] = entries
 
         # Execute callbacks WITHOUT holding lock (prevent deadlock)
-        # Order: specific to general
-
-        # Per-control callbacks
-        for callback, filter_type in control_cbs:
-            if filter_type is None or filter_type == signal_type:
+        for callback, pass_control_id in entries:
+            if pass_control_id:
+                self._safe_call(callback, control_id, state)
+            else:
                 self._safe_call(callback, state)
 
-        # Category-based callbacks
-        for callback, filter_type in category_cbs:
-            if filter_type is None or filter_type == signal_type:
-                self._safe_call(callback, control_id, state)
+    def _build_dispatch(
+        self,
+        control_id: str,
+        control_type: ControlType,
+        category: Optional[str],
+        signal_type: str,
+    ) -> tuple[tuple[Callable, bool], ...]:
+        """
+        Flatten matching callbacks into dispatch order (call with lock held).
 
-        # Type-based callbacks
-        for callback, filter_type in type_cbs:
-            if filter_type is None or filter_type == signal_type:
-                self._safe_call(callback, control_id, state)
+        Order: specific to general (per-control, category, type, global).
 
-        # Global callbacks
-        for callback, filter_type in global_cbs:
+        Returns:
+            Tuple of (callback, pass_control_id) pairs
+        """
+        entries: list[tuple[Callable, bool]] = []
+
+        # Per-control callbacks receive only the state
+        for callback, filter_type in self._control_callbacks.get(control_id, ()):
             if filter_type is None or filter_type == signal_type:
-                self._safe_call(callback, control_id, state)
+                entries.append((callback, False))
+
+        # Category-, type-based and global callbacks receive (control_id, state)
+        groups = (
+            self._category_callbacks.get(category, ()) if category else (),
+            self._type_callbacks.get(control_type, ()),
+            self._global_callbacks,
+        )
+        for callbacks in groups:
+            for callback, filter_type in callbacks:
+                if filter_type is None or filter_type == signal_type:
+                    entries.append((callback, True))
+
+        return tuple(entries)
 
     def on_bank_change(self, control_type: ControlType, bank_id: str) -> None:
         """
@@ -6,7 +6,8 @@ and colors across banks in multi-bank MIDI controllers.
 """
 
 import re
-from typing import Optional
+from dataclasses import dataclass
+from typing import Iterable, Optional
 
 from pydantic import BaseModel, field_validator, model_validator
 
@@ -33,8 +34,8 @@ class ControlConfig(BaseModel):
     type: ControlType
     on_color: Optional[str] = None  # ON state color: Named color, hex (#FF0000), or rgb(r,g,b)
     off_color: Optional[str] = None  # OFF state color (defaults to black if not specified)
-    on_led_mode: LEDMode = LEDMode(animation_type=LEDAnimationType.SOLID)
-    off_led_mode: LEDMode = LEDMode(animation_type=LEDAnimationType.SOLID)
+    on_led_mode: LEDMode = LEDMode.get(LEDAnimationType.SOLID)
+    off_led_mode: LEDMode = LEDMode.get(LEDAnimationType.SOLID)
 
     @field_validator("on_led_mode", "off_led_mode", mode="before")
     @classmethod
@@ -43,7 +44,7 @@ class ControlConfig(BaseModel):
         if isinstance(v, str):
             try:
                 animation_type = LEDAnimationType(v)
-                return LEDMode(animation_type=animation_type)
+                return LEDMode.get(animation_type)
             except ValueError as err:
                 raise ValueError(f"led_mode must be 'solid', 'pulse', or 'blink', got '{v}'") from err
         return v
@@ -120,6 +121,101 @@ class ControllerConfig(BaseModel):
         return self.banks is not None
 
 
+@dataclass(frozen=True, slots=True)
+class ResolvedControl:
+    """
+    Resolved control type, colors, and LED modes for a control.
+
+    Built once per configured ControlConfig (and once per control type for
+    plugin defaults) and shared by every control it applies to.
+    """
+
+    type: ControlType
+    on_color: Optional[str] = None
+    off_color: Optional[str] = None
+    on_led_mode: Optional[LEDMode] = None
+    off_led_mode: Optional[LEDMode] = None
+
+    @classmethod
+    def from_config(cls, control_config: ControlConfig) -> "ResolvedControl":
+        """Create from a user ControlConfig."""
+        return cls(
+            type=control_config.type,
+            on_color=control_config.on_color,
+            off_color=control_config.off_color,
+            on_led_mode=control_config.on_led_mode,
+            off_led_mode=control_config.off_led_mode,
+        )
+
+
+# Plugin-default resolutions only depend on the control type
+_DEFAULT_RESOLUTIONS: dict[ControlType, ResolvedControl] = {
+    control_type: ResolvedControl(type=control_type) for control_type in ControlType
+}
+
+
+class _WildcardPatterns:
+    """
+    Wildcard control patterns bucketed by their literal prefix.
+
+    "pad_*" is stored under "pad_", "enc_*_top" under "enc_". Matching only
+    tries the buckets whose prefix the control ID starts with, so a config
+    with many differently-prefixed patterns costs one regex trial per
+    applicable pattern instead of one per pattern. When several patterns
+    match, the one listed first in the config wins.
+    """
+
+    __slots__ = ("_buckets", "_prefix_lengths")
+
+    def __init__(self):
+        # prefix -> [(config order, compiled regex, resolution)]
+        self._buckets: dict[str, list[tuple[int, re.Pattern, ResolvedControl]]] = {}
+        self._prefix_lengths: list[int] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._buckets)
+
+    def add(self, order: int, pattern: str, resolved: ResolvedControl) -> None:
+        """Add a glob pattern ("pad_*") with its position in the config."""
+        prefix = pattern.split("*", 1)[0]
+        # Convert glob pattern to regex
+        regex_pattern = pattern.replace("*", ".*")
+        compiled = re.compile(f"^{regex_pattern}$")
+
+        if prefix not in self._buckets:
+            self._buckets[prefix] = []
+            self._prefix_lengths = sorted({*self._prefix_lengths, len(prefix)})
+        self._buckets[prefix].append((order, compiled, resolved))
+
+    def match(self, control_id: str) -> Optional[ResolvedControl]:
+        """Return the resolution of the first pattern matching control_id, if any."""
+        best: Optional[tuple[int, re.Pattern, ResolvedControl]] = None
+
+        for length in self._prefix_lengths:
+            if length > len(control_id):
+                break
+            bucket = self._buckets.get(control_id[:length])
+            if bucket is None:
+                continue
+            for entry in bucket:
+                if best is not None and entry[0] > best[0]:
+                    break
+                if entry[1].match(control_id):
+                    best = entry
+                    break
+
+        return best[2] if best is not None else None
+
+
+@dataclass(slots=True)
+class _CompiledControls:
+    """Compiled controls mapping: exact IDs plus wildcard patterns."""
+
+    exact: dict[str, ResolvedControl]
+    wildcard_full: _WildcardPatterns  # All patterns, matched against full IDs ("pad_*@bank_1", "pad_*")
+    wildcard_base: _WildcardPatterns  # Plain patterns only, matched against base IDs ("pad_*")
+
+
 class ControlConfigResolver:
     """
     Resolves control configuration from user config and plugin defaults.
@@ -131,52 +227,114 @@ class ControlConfigResolver:
     4. Plugin default
     """
 
+    __slots__ = (
+        "_config",
+        "_validated",
+        "_flat_exact",
+        "_flat_wild_full",
+        "_flat_wild_base",
+        "_bank_configs",
+        "_find_config",
+    )
+
     def __init__(self, config: Optional[ControllerConfig] = None):
         """Initialize resolver with user configuration."""
         self._config = config
+        # (control_id, resolved_type) pairs already checked against plugin capabilities
+        self._validated: set[tuple[str, ControlType]] = set()
+
+        # Lookup strategy is fixed by the config mode, so bind it once here
+        # instead of branching on the mode for every resolution
+        self._flat_exact = None
+        self._flat_wild_full = None
+        self._flat_wild_base = None
+        self._bank_configs = None
 
         if config is None:
-            self._is_bank_aware = False
-            self._flat_config = None
-            self._bank_configs = None
+            self._find_config = self._find_no_config
         elif config.is_bank_aware():
-            self._is_bank_aware = True
-            self._flat_config = None
             # Pre-compile wildcard patterns per bank
             self._bank_configs = {}
             for bank_id, bank_config in config.banks.items():
                 self._bank_configs[bank_id] = self._compile_config(bank_config.controls)
+            self._find_config = self._find_bank_config
         else:
-            self._is_bank_aware = False
-            self._flat_config = self._compile_config(config.controls)
-            self._bank_configs = None
+            flat = self._compile_config(config.controls)
+            self._flat_exact = flat.exact
+            self._flat_wild_full = flat.wildcard_full
+            self._flat_wild_base = flat.wildcard_base
+            self._find_config = self._find_flat_config
 
-    def _compile_config(self, controls: dict[str, ControlConfig]) -> tuple[dict, list]:
+    def _compile_config(
+        self,
+        controls: dict[str, ControlConfig],
+    ) -> _CompiledControls:
         """
         Compile config into exact matches and wildcard patterns.
 
+        Every wildcard pattern can match a full control ID, but only plain
+        patterns (no "@bank" qualifier) can match a base ID, so bank-qualified
+        patterns are left out of the base-ID bucket.
+
+        Each ControlConfig is converted to a ResolvedControl here, so
+        resolution hands out shared instances instead of building a result
+        per control.
+
         Returns:
-            (exact_matches dict, wildcard_patterns list)
+            Compiled exact matches and wildcard patterns
         """
-        exact_matches = {}
-        wildcard_patterns = []
+        exact_matches: dict[str, ResolvedControl] = {}
+        wildcard_full = _WildcardPatterns()
+        wildcard_base = _WildcardPatterns()
 
-        for pattern, control_config in controls.items():
+        for order, (pattern, control_config) in enumerate(controls.items()):
+            resolved = ResolvedControl.from_config(control_config)
             if "*" in pattern:
-                # Convert glob pattern to regex
-                regex_pattern = pattern.replace("*", ".*")
-                compiled = re.compile(f"^{regex_pattern}$")
-                wildcard_patterns.append((compiled, control_config))
+                wildcard_full.add(order, pattern, resolved)
+                if "@" not in pattern:
+                    wildcard_base.add(order, pattern, resolved)
             else:
-                exact_matches[pattern] = control_config
+                exact_matches[pattern] = resolved
 
-        return (exact_matches, wildcard_patterns)
+        return _CompiledControls(exact=exact_matches, wildcard_full=wildcard_full, wildcard_base=wildcard_base)
 
-    def resolve_config(
-        self,
-        control_id: str,
-        definition: ControlDefinition,
-    ) -> tuple[ControlType, Optional[str], Optional[str], Optional[str], Optional[str]]:
+    def precheck(self, definitions: Iterable[ControlDefinition]) -> None:
+        """
+        Eagerly validate configured control types against plugin definitions.
+
+        Resolves every definition once so that capability conflicts surface
+        up front instead of on first resolution. Validated controls are
+        remembered and not re-checked by resolve_config().
+
+        Args:
+            definitions: Plugin's control definitions
+
+        Raises:
+            CapabilityError: If a configured type is not supported by a control
+        """
+        if self._config is None:
+            return
+
+        for definition in definitions:
+            self.resolve_config(definition.control_id, definition)
+
+    def build_index(self, definitions: Iterable[ControlDefinition]) -> dict[str, ResolvedControl]:
+        """
+        Resolve every plugin definition in one pass.
+
+        Args:
+            definitions: Plugin's control definitions
+
+        Returns:
+            Mapping of control_id to its ResolvedControl
+
+        Raises:
+            CapabilityError: If a configured type is not supported by a control
+        """
+        resolve = self.resolve_config
+        return {definition.control_id: resolve(definition.control_id, definition) for definition in definitions}
+
+    def resolve_config(self, control_id: str, definition: ControlDefinition) -> ResolvedControl:
         """
         Resolve control type, colors, and LED modes for a control.
 
@@ -185,71 +343,78 @@ class ControlConfigResolver:
             definition: Plugin's control definition
 
         Returns:
-            (resolved_type, on_color, off_color, on_led_mode, off_led_mode)
+            ResolvedControl from user config, or the plugin default
+            (definition's type, no colors or LED modes)
 
         Raises:
             CapabilityError: If requested type not supported by control
         """
+        resolved = self._find_config(control_id)
+
+        if resolved is None:
+            # Fall back to plugin default
+            logger.debug("Control '%s': using plugin default", control_id)
+            return _DEFAULT_RESOLUTIONS[definition.control_type]
+
+        if (control_id, resolved.type) not in self._validated:
+            self._validate_supported(control_id, resolved.type, definition)
+            self._validated.add((control_id, resolved.type))
+
+        return resolved
+
+    def _find_no_config(self, control_id: str) -> Optional[ResolvedControl]:
+        """Lookup used when no user configuration was provided."""
+        return None
+
+    def _find_bank_config(self, control_id: str) -> Optional[ResolvedControl]:
+        """
+        Find user config for a control in bank-aware mode.
+
+        Returns:
+            Matching ResolvedControl, or None if the control's bank has no match
+        """
         # Parse control_id to extract base ID and bank
         control_base_id, bank_id = self._parse_control_id(control_id)
 
-        control_config = None
-
-        # Try bank-aware resolution first
-        if self._is_bank_aware and bank_id and bank_id in self._bank_configs:
-            exact_matches, wildcard_patterns = self._bank_configs[bank_id]
-
-            # Try exact match
-            if control_base_id in exact_matches:
-                control_config = exact_matches[control_base_id]
-                logger.debug(f"Control '{control_id}': exact match in {bank_id}")
-
-            # Try wildcard matches
-            if not control_config:
-                for pattern, config in wildcard_patterns:
-                    if pattern.match(control_base_id):
-                        control_config = config
-                        logger.debug(f"Control '{control_id}': wildcard match in {bank_id}")
-                        break
-
-        # Try flat config fallback
-        if not control_config and self._flat_config:
-            exact_matches, wildcard_patterns = self._flat_config
-
-            # Try full control_id first, then base ID
-            for check_id in [control_id, control_base_id]:
-                if check_id in exact_matches:
-                    control_config = exact_matches[check_id]
-                    break
+        bank_data = self._bank_configs.get(bank_id) if bank_id else None
+        if bank_data is None:
+            return None
 
-            # Try wildcard matches
-            if not control_config:
-                for check_id in [control_id, control_base_id]:
-                    for pattern, config in wildcard_patterns:
-                        if pattern.match(check_id):
-                            control_config = config
-                            break
-                    if control_config:
-                        break
-
-        # Extract type, colors, and LED modes
-        if control_config:
-            resolved_type = control_config.type
-            on_color = control_config.on_color
-            off_color = control_config.off_color
-            on_led_mode = control_config.on_led_mode
-            off_led_mode = control_config.off_led_mode
-            self._validate_supported(control_id, resolved_type, definition)
-        else:
-            # Fall back to plugin default
-            resolved_type = definition.control_type
-            on_color = None
-            off_color = None
-            on_led_mode = None
-            off_led_mode = None
-            logger.debug(f"Control '{control_id}': using plugin default")
+        # Try exact match
+        exact_matches = bank_data.exact
+        if control_base_id in exact_matches:
+            logger.debug("Control '%s': exact match in %s", control_id, bank_id)
+            return exact_matches[control_base_id]
+
+        # Try wildcard matches
+        resolved = bank_data.wildcard_base.match(control_base_id)
+        if resolved is not None:
+            logger.debug("Control '%s': wildcard match in %s", control_id, bank_id)
+        return resolved
+
+    def _find_flat_config(self, control_id: str) -> Optional[ResolvedControl]:
+        """
+        Find user config for a control in flat mode.
+
+        Returns:
+            Matching ResolvedControl, or None if nothing matches
+        """
+        # Parse control_id to extract base ID and bank
+        control_base_id, bank_id = self._parse_control_id(control_id)
+
+        # Try full control_id first, then base ID
+        exact_matches = self._flat_exact
+        for check_id in [control_id, control_base_id]:
+            if check_id in exact_matches:
+                return exact_matches[check_id]
 
-        return (resolved_type, on_color, off_color, on_led_mode, off_led_mode)
+        # Try wildcard matches against the full ID, then plain patterns against
+        # the base ID. Without a bank the two IDs are equal, so one pass suffices.
+        if bank_id is not None:
+            resolved = self._flat_wild_full.match(control_id)
+            if resolved is not None:
+                return resolved
+        return self._flat_wild_base.match(control_base_id)
 
     def _parse_control_id(self, control_id: str) -> tuple[str, Optional[str]]:
         """
@@ -290,7 +455,7 @@ class ControlConfigResolver:
                 )
         else:
             # Check if requested type is in supported types
-            if requested_type not in definition.type_modes.supported_types:
+            if requested_type not in definition.type_modes.supported_type_set:
                 supported_str = ", ".join(t.value for t in definition.type_modes.supported_types)
                 raise CapabilityError(
                     f"Control '{control_id}' does not support type "
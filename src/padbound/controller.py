@@ -5,14 +5,17 @@ This module provides the primary Controller class that orchestrates all
 components and provides a simple API for working with MIDI controllers.
 """
 
+import threading
 import time
-from typing import Optional, Union
-
-import mido
+from typing import TYPE_CHECKING, Callable, ClassVar, Optional, Union
 
 from padbound.callbacks import CallbackManager
-from padbound.config import ControlConfigResolver, ControllerConfig
+from padbound.config import ControlConfigResolver, ControllerConfig, ResolvedControl
 from padbound.controls import (
+    CAP_COLOR,
+    CAP_FEEDBACK,
+    CAP_REQUIRES_FEEDBACK,
+    CAP_VALUE_SETTING,
     CapabilityError,
     ContinuousControl,
     Control,
@@ -21,6 +24,7 @@ from padbound.controls import (
     ControlState,
     ControlType,
     LEDAnimationType,
+    LEDMode,
     MomentaryControl,
     ToggleControl,
 )
@@ -30,6 +34,11 @@ from padbound.plugin import ControllerPlugin
 from padbound.registry import plugin_registry
 from padbound.state import ControllerState
 
+if TYPE_CHECKING:
+    import mido
+
+    from padbound.debug.layout import DebugLayout
+
 # Import debug server conditionally to avoid loading when not needed
 try:
     from padbound.debug.server import StateBroadcaster
@@ -41,6 +50,17 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+_NOT_CONNECTED_MESSAGE = "Controller not connected. Call connect() first."
+
+
+def _discard_feedback(messages: list["mido.Message"], delays: Optional[list[float]] = None, delay: float = 0.0) -> int:
+    """Feedback sender used while no MIDI interface is connected (drops messages)."""
+    return 0
+
+
+# State fields compared by set_states(skip_unchanged=True)
+_COMPARED_STATE_FIELDS = ("is_on", "value", "color", "led_mode")
+
 
 class Controller:
     """
@@ -55,6 +75,13 @@ class Controller:
     - Bank management (when supported)
     """
 
+    # Control class for each resolved control type
+    _CTRL_CLASSES: ClassVar[dict[ControlType, type[Control]]] = {
+        ControlType.TOGGLE: ToggleControl,
+        ControlType.MOMENTARY: MomentaryControl,
+        ControlType.CONTINUOUS: ContinuousControl,
+    }
+
     def __init__(
         self,
         plugin: Optional[Union[str, ControllerPlugin]] = None,
@@ -64,12 +91,16 @@ class Controller:
         debug_server: bool = False,
         debug_host: str = "127.0.0.1",
         debug_port: int = 8765,
+        coalesce_continuous: bool = False,
+        coalesce_interval: float = 0.0,
+        auto_batch: bool = False,
     ):
         """
         Initialize controller.
 
         Args:
             plugin: Plugin name, instance, or 'auto' for auto-detection.
+                   Auto-detection is deferred until connect().
                    If None, must call connect() manually.
             config: Controller configuration (Pydantic model) for control types and colors.
                    Optional - if not provided, uses plugin defaults.
@@ -79,9 +110,20 @@ class Controller:
             debug_server: If True, start a WebSocket server for state debugging
             debug_host: Host for the debug WebSocket server
             debug_port: Port for the debug WebSocket server
+            coalesce_continuous: If True, callbacks and auto-feedback for continuous
+                        controls fire once per process_events() with the latest state,
+                        instead of once per MIDI message. State is still updated per message.
+            coalesce_interval: Minimum seconds between coalesced flushes (0 = every
+                        process_events() call). Only used with coalesce_continuous.
+            auto_batch: If True, set_state() queues validated updates instead of sending
+                        them; queued updates are sent as one feedback batch on the
+                        next process_events(), flush_feedback() or disconnect().
         """
         self._plugin: Optional[ControllerPlugin] = None
+        self._plugin_spec: Optional[str] = None  # 'auto' until detected on connect
         self._strict_mode = strict_mode
+        # Unsupported-operation handling is fixed by strict_mode, so bind it once
+        self._handle_unsupported_operation = self._raise_capability_error if strict_mode else self._warn_capability
         self._connected = False
 
         # Components (initialized on connect)
@@ -89,6 +131,47 @@ class Controller:
         self._callbacks: CallbackManager = CallbackManager()
         self._midi: Optional[MIDIInterface] = None
 
+        # Controller capability values used on hot paths (snapshotted on connect)
+        self._feedback_delay = 0.0
+        self._supports_persistent_config = False
+
+        # Plugin control definitions (cached on connect)
+        self._control_defs: tuple[ControlDefinition, ...] = ()
+        # Feedback-capable controls with an on/off color per bank, repainted on bank switch
+        self._feedback_controls_by_bank: dict[str, list[Control]] = {}
+
+        # Feedback sender: MIDIInterface.send_with_delays while connected, else a no-op
+        self._send_paced = _discard_feedback
+        # Plugin feedback translator, bound on connect so auto-feedback skips the plugin lookup
+        self._translate_feedback: Optional[Callable[[str, dict], list["mido.Message"]]] = None
+
+        # Last feedback state sent per control, used to skip redundant LED writes
+        self._last_sent: dict[str, dict] = {}
+
+        # Reused feedback state dict for the per-message auto-feedback path
+        self._fb_scratch: dict = {
+            "is_on": None,
+            "value": None,
+            "color": None,
+            "normalized_value": None,
+            "led_mode": None,
+            "definition_led_mode": None,
+        }
+
+        # Continuous-control coalescing (optional)
+        # Latest (control, state, trigger_callback) per (control_id, signal_type) since last flush
+        self._coalesce_continuous = coalesce_continuous
+        self._coalesce_interval = coalesce_interval
+        self._pending_continuous: dict[tuple[str, str], tuple[Control, ControlState, bool]] = {}
+        self._last_flush = 0.0
+
+        # set_state() batching (optional)
+        # Merged pending kwargs per control_id, sent as one feedback batch on flush.
+        # Guarded by its own lock: set_state() may race with flush_feedback().
+        self._auto_batch = auto_batch
+        self._pending_feedback: dict[str, dict] = {}
+        self._pending_feedback_lock = threading.Lock()
+
         # Debug server (optional)
         self._debug_server_enabled = debug_server
         self._debug_host = debug_host
@@ -99,28 +182,44 @@ class Controller:
         self._controller_config = config
         self._config_resolver = ControlConfigResolver(config)
 
-        # Resolve plugin
-        if isinstance(plugin, str):
-            if plugin == "auto":
-                self._plugin = plugin_registry.detect()
-                if not self._plugin:
-                    raise ValueError("No controller auto-detected. Please specify plugin explicitly.")
-            else:
-                self._plugin = plugin_registry.get_plugin(plugin)
-                if not self._plugin:
-                    raise ValueError(f"Unknown plugin: {plugin}")
-        elif isinstance(plugin, ControllerPlugin):
-            self._plugin = plugin
+        # Resolve plugin (auto-detection probes MIDI ports, so it waits for connect)
+        self._plugin = self._resolve_plugin(plugin)
+        if plugin == "auto":
+            self._plugin_spec = plugin
 
-        # Validate bank configurations against plugin constraints
-        if self._plugin and config and config.banks:
-            for bank_id, bank_config in config.banks.items():
-                self._plugin.validate_bank_config(bank_id, bank_config, self._strict_mode)
+        if self._plugin:
+            self._validate_config_for_plugin()
 
         # Auto-connect if requested
-        if auto_connect and self._plugin:
+        if auto_connect and (self._plugin or self._plugin_spec):
             self.connect()
 
+    @staticmethod
+    def _resolve_plugin(plugin: Optional[Union[str, ControllerPlugin]]) -> Optional[ControllerPlugin]:
+        """
+        Resolve the plugin argument to a plugin instance.
+
+        Args:
+            plugin: Plugin instance, registered plugin name, "auto", or None
+
+        Returns:
+            Plugin instance, or None when no plugin was given or detection is
+            deferred to connect() ("auto")
+
+        Raises:
+            ValueError: If the plugin name is not registered
+        """
+        # Instances first: the common path for programmatic use
+        if isinstance(plugin, ControllerPlugin):
+            return plugin
+        if plugin is None or plugin == "auto":
+            return None
+
+        resolved = plugin_registry.get_plugin(plugin)
+        if not resolved:
+            raise ValueError(f"Unknown plugin: {plugin}")
+        return resolved
+
     @property
     def capabilities(self) -> Optional[ControllerCapabilities]:
         """Get controller capabilities."""
@@ -155,6 +254,13 @@ class Controller:
             ValueError: If no plugin configured
             IOError: If connection fails
         """
+        if not self._plugin and self._plugin_spec == "auto":
+            self._plugin = plugin_registry.detect()
+            if not self._plugin:
+                raise ValueError("No controller auto-detected. Please specify plugin explicitly.")
+            self._plugin_spec = None
+            self._validate_config_for_plugin()
+
         if not self._plugin:
             raise ValueError("No plugin configured. Pass plugin to __init__ or call with plugin parameter")
 
@@ -177,20 +283,65 @@ class Controller:
         # Initialize MIDI interface
         self._midi = MIDIInterface(on_message=self._on_midi_message)
         self._midi.connect(input_port, output_port)
+        self._send_paced = self._midi.send_with_delays
+        self._translate_feedback = self._plugin.translate_feedback
 
         # Initialize state management
-        # Get controller capabilities from plugin
+        # Get controller capabilities and control definitions from plugin
+        # (definitions may already be materialized by the config precheck in __init__)
         capabilities = self._plugin.get_capabilities()
+        if not self._control_defs:
+            self._control_defs = tuple(self._plugin.get_control_definitions())
         self._state = ControllerState(capabilities)
+        self._feedback_delay = capabilities.feedback_message_delay
+        self._supports_persistent_config = capabilities.supports_persistent_configuration
 
         # Register all controls from plugin
-        for control_def in self._plugin.get_control_definitions():
-            control = self._create_control(control_def)
-            self._state.register_control(control)
+        self._feedback_controls_by_bank = {}
+        self._last_sent = {}
+        resolved_index = self._config_resolver.build_index(self._control_defs)
+        controls = [
+            self._create_control(control_def, resolved_index[control_def.control_id])
+            for control_def in self._control_defs
+        ]
+        self._state.register_controls(controls)
+
+        # Initial LED updates for controls with feedback support and a configured off color
+        initial_updates: list[tuple[str, dict]] = []
+        initial_controls: list[Control] = []
+        for control_def, control in zip(self._control_defs, controls):
+            if not control._cap_flags & CAP_FEEDBACK:
+                continue
+            definition = control.definition
+            if definition.off_color is not None:
+                initial_updates.append(
+                    (
+                        definition.control_id,
+                        {
+                            "is_on": False,
+                            "value": 0,
+                            "color": definition.off_color,
+                            "normalized_value": None,
+                            "led_mode": definition.off_led_mode,  # OFF state LED mode
+                            "definition_led_mode": definition.off_led_mode,  # Configured mode for OFF state
+                        },
+                    ),
+                )
+                initial_controls.append(control)
+            # Bank LED refresh only needs controls that have a color to show
+            if control_def.bank_id is not None and control._colors != (None, None):
+                self._feedback_controls_by_bank.setdefault(control_def.bank_id, []).append(control)
+
+        # Plugins send through the MIDI interface directly (no wrapper call per message)
+        send_message = self._midi.send_message
 
         # Call plugin init to set controller to known state
         logger.info(f"Initializing controller: {self._plugin.name}")
-        discovered_values = self._plugin.init(self._send_message, self._midi.receive_message)
+        discovered_values = self._plugin.init(send_message, self._midi.receive_message)
+
+        # Some devices (e.g., APC mini) need time after init message before accepting LED commands.
+        # The init and configure waits overlap, so track a single deadline and sleep once.
+        device_ready_at = time.monotonic() + capabilities.post_init_delay
 
         # Apply any discovered values (e.g., fader positions) to control state
         if discovered_values:
@@ -201,52 +352,33 @@ class Controller:
                     logger.debug(f"Applied discovered value: {control_id}={value}")
 
         # Program persistent configuration (if plugin supports it)
-        if self._controller_config and self._state.capabilities.supports_persistent_configuration:
+        if self._controller_config and self._supports_persistent_config:
             logger.info("Programming persistent configuration into device")
-            self._plugin.configure_programs(self._send_message, self._controller_config)
+            self._plugin.configure_programs(send_message, self._controller_config)
 
             # Give device time to process the configuration before LED updates
-            time.sleep(0.2)
+            device_ready_at = max(device_ready_at, time.monotonic() + capabilities.post_configure_delay)
 
-        # Wait for device to complete async initialization (if needed)
-        # Some devices (e.g., APC mini) need time after init message before accepting LED commands
-        if self._state.capabilities.post_init_delay > 0:
-            logger.debug(f"Waiting {self._state.capabilities.post_init_delay}s for device init to complete")
-            time.sleep(self._state.capabilities.post_init_delay)
+        # Wait for device to complete async initialization and configuration (if needed)
+        remaining = device_ready_at - time.monotonic()
+        if remaining > 0:
+            logger.debug(f"Waiting {remaining:.3f}s for device init to complete")
+            time.sleep(remaining)
 
         # Display initial LED states for controls with configured colors
         # This lights up pads with their off_color to show the configured layout
         logger.debug("Setting initial LED states from configuration")
-        feedback_delay = self._state.capabilities.feedback_message_delay
-        for control_def in self._plugin.get_control_definitions():
-            control = self._state.get_control(control_def.control_id)
-            if not control:
-                continue
-
-            # Only send feedback for controls with color support and configured colors
-            if control.definition.capabilities.supports_feedback and control.definition.off_color is not None:
-                state_dict = {
-                    "is_on": False,
-                    "value": 0,
-                    "color": control.definition.off_color,
-                    "normalized_value": None,
-                    "led_mode": control.definition.off_led_mode,  # OFF state LED mode
-                    "definition_led_mode": control.definition.off_led_mode,  # Configured mode for OFF state
-                }
-                messages = self._plugin.translate_feedback(control.definition.control_id, state_dict)
-                for msg in messages:
-                    self._send_message(msg)
-                    # Add inter-message delay if device needs it (prevents buffer overflow)
-                    if feedback_delay > 0:
-                        time.sleep(feedback_delay)
+        if initial_updates:
+            # Use the plugin's batch path (e.g., single SysEx for all LPD8 pads)
+            result = self._plugin.translate_feedback_batch(initial_updates)
+            # Inter-message delay is applied if device needs it (prevents buffer overflow)
+            self._send_feedback(result.messages, self._feedback_delay, result.delays)
+            for control, (_, state_dict) in zip(initial_controls, initial_updates):
+                self._record_sent(control, state_dict)
 
         # Ensure control states have correct colors for debug server
         # This handles edge cases where update_state() may not set colors correctly
-        for control_def in self._plugin.get_control_definitions():
-            control = self._state.get_control(control_def.control_id)
-            if not control:
-                continue
-
+        for control_def, control in zip(self._control_defs, controls):
             # For controls with color support, ensure state color matches what was sent to hardware
             if control.definition.capabilities.supports_color:
                 current_state = control.state
@@ -267,16 +399,8 @@ class Controller:
             self._broadcaster = StateBroadcaster(host=self._debug_host, port=self._debug_port)
             self._broadcaster.start()
 
-            # Cache full state for new client connections
-            states = self._state.get_all_states()
-            definitions = self._state.get_all_definitions()  # Get definitions with resolved colors
-            layout = self._plugin.get_debug_layout()
-            self._broadcaster.set_full_state(
-                plugin_name=self._plugin.name,
-                layout=layout,
-                states=states,
-                definitions=definitions,
-            )
+            # Full state is built when the first debug client connects
+            self._broadcaster.set_full_state_provider(self._debug_full_state)
 
             # Register callback for state broadcasting
             self._callbacks.register_global(self._on_state_change_for_debug)
@@ -290,6 +414,10 @@ class Controller:
         if not self._connected:
             return
 
+        # Send any batched set_state() updates before the device is shut down
+        if self._pending_feedback:
+            self.flush_feedback()
+
         # Stop debug server
         if self._broadcaster:
             self._callbacks.unregister_global(self._on_state_change_for_debug)
@@ -300,13 +428,22 @@ class Controller:
         # Call plugin shutdown
         if self._plugin and self._midi:
             logger.info(f"Shutting down controller: {self._plugin.name}")
-            self._plugin.shutdown(self._send_message)
+            self._plugin.shutdown(self._midi.send_message)
 
         # Disconnect MIDI
+        self._send_paced = _discard_feedback
+        self._translate_feedback = None
         if self._midi:
             self._midi.disconnect()
             self._midi = None
 
+        self._control_defs = ()
+        self._feedback_controls_by_bank = {}
+        self._last_sent = {}
+        self._pending_continuous = {}
+        self._pending_feedback = {}
+        self._feedback_delay = 0.0
+        self._supports_persistent_config = False
         self._connected = False
         logger.info("Controller disconnected")
 
@@ -343,7 +480,7 @@ class Controller:
 
         self._ensure_connected()
 
-        if not self._state.capabilities.supports_persistent_configuration:
+        if not self._supports_persistent_config:
             raise NotImplementedError(f"Plugin '{self._plugin.name}' does not support persistent configuration")
 
         # Use provided config or current config
@@ -361,9 +498,14 @@ class Controller:
             logger.warning("No configuration available to program")
             return
 
+        # Device LEDs no longer match what was last sent
+        self._last_sent.clear()
+        if self._broadcaster:
+            self._broadcaster.invalidate_full_state()
+
         # Reprogram device
         logger.info("Reprogramming device with new configuration")
-        self._plugin.configure_programs(self._send_message, config_to_use)
+        self._plugin.configure_programs(self._midi.send_message, config_to_use)
 
         logger.info("Device reconfiguration complete")
 
@@ -379,7 +521,8 @@ class Controller:
         Returns:
             Current state or None if control not found
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
         return self._state.get_state(control_id)
 
     def get_all_states(self) -> dict[str, ControlState]:
@@ -389,7 +532,8 @@ class Controller:
         Returns:
             Dictionary mapping control_id to ControlState
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
         return self._state.get_all_states()
 
     def get_discovered_controls(self) -> list[str]:
@@ -399,9 +543,15 @@ class Controller:
         Returns:
             List of control IDs that have been interacted with
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
         return self._state.get_discovered_controls()
 
+    @property
+    def discovered_count(self) -> int:
+        """Number of controls with known state (0 if not connected)."""
+        return self._state.discovered_count if self._state else 0
+
     def get_undiscovered_controls(self) -> list[str]:
         """
         Get list of controls with unknown state.
@@ -409,7 +559,8 @@ class Controller:
         Returns:
             List of control IDs not yet interacted with
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
         return self._state.get_undiscovered_controls()
 
     def get_controls(self) -> list[ControlDefinition]:
@@ -422,11 +573,11 @@ class Controller:
         self._ensure_connected()
         if not self._plugin:
             return []
-        return self._plugin.get_control_definitions()
+        return list(self._control_defs)
 
     # Programmatic state control
 
-    def set_state(self, control_id: str, **kwargs) -> None:
+    def set_state(self, control_id: str, force: bool = False, **kwargs) -> None:
         """
         Set control state programmatically (sends hardware feedback).
 
@@ -434,8 +585,16 @@ class Controller:
         - Strict mode: Raises CapabilityError for unsupported operations
         - Permissive mode: Logs warning and returns without error
 
+        For controls whose LEDs are driven entirely by the library
+        (requires_feedback), an update identical to the last one sent is skipped.
+
+        With auto_batch enabled, validated updates are queued (later calls for the
+        same control are merged) and sent together by flush_feedback(). Forced
+        updates are sent immediately, merged over anything queued for the control.
+
         Args:
             control_id: Control identifier
+            force: If True, send feedback even if it matches the last state sent
             **kwargs: State parameters (is_on, value, color, etc.)
 
         Raises:
@@ -446,54 +605,62 @@ class Controller:
             controller.set_state('pad_1', is_on=True, color='red')
             controller.set_state('fader_1', value=64)
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
 
         # Get control
         control = self._state.get_control(control_id)
         if not control:
             raise ValueError(f"Unknown control: {control_id}")
 
-        capabilities = control.definition.capabilities
+        definition = control.definition
+        cap_flags = control._cap_flags
 
         # Check if feedback supported at all
-        if not capabilities.supports_feedback:
+        if not cap_flags & CAP_FEEDBACK:
             self._handle_unsupported_operation(f"Control '{control_id}' does not support feedback")
             return
 
         # Validate specific operations
-        if "value" in kwargs and not capabilities.supports_value_setting:
+        if "value" in kwargs and not cap_flags & CAP_VALUE_SETTING:
             self._handle_unsupported_operation(f"Control '{control_id}' does not support value setting (not motorized)")
             return
 
         if "color" in kwargs:
-            if not capabilities.supports_color:
+            if not cap_flags & CAP_COLOR:
                 self._handle_unsupported_operation(f"Control '{control_id}' does not support color")
                 return
 
             # Validate color against palette
-            if not self._state.validate_color(control_id, kwargs["color"]):
-                color = kwargs["color"]
-                palette = capabilities.color_palette
+            color = kwargs["color"]
+            if control._palette_set is not None and color not in control._palette_set:
+                palette = definition.capabilities.color_palette
                 self._handle_unsupported_operation(
                     f"Color '{color}' not in palette {palette} for control '{control_id}'",
                 )
                 return
 
-        # All checks passed - translate to MIDI and send
+        # All checks passed - queue for the next batch flush if batching
+        if self._auto_batch:
+            with self._pending_feedback_lock:
+                if not force:
+                    self._pending_feedback.setdefault(control_id, {}).update(kwargs)
+                    return
+                queued = self._pending_feedback.pop(control_id, None)
+            if queued:
+                kwargs = {**queued, **kwargs}
+
+        # Otherwise translate to MIDI and send
         if self._plugin:
             # Include definition LED mode for plugins that need it (e.g., APC mini MK2)
             if "definition_led_mode" not in kwargs:
-                is_on = kwargs.get("is_on", False)
-                kwargs["definition_led_mode"] = (
-                    control.definition.on_led_mode if is_on else control.definition.off_led_mode
-                )
+                kwargs["definition_led_mode"] = control._led_modes[1 if kwargs.get("is_on") else 0]
+            if not force and self._is_redundant(control, kwargs):
+                return
             messages = self._plugin.translate_feedback(control_id, kwargs)
-            feedback_delay = self._state.capabilities.feedback_message_delay
-            for msg in messages:
-                self._send_message(msg)
-                # Add inter-message delay if device needs it (e.g., APC mini MK2)
-                if feedback_delay > 0:
-                    time.sleep(feedback_delay)
+            # Inter-message delay is applied if device needs it (e.g., APC mini MK2)
+            self._send_feedback(messages, self._feedback_delay)
+            self._record_sent(control, kwargs)
 
     def can_set_state(self, control_id: str, **kwargs) -> bool:
         """
@@ -517,18 +684,18 @@ class Controller:
             if not control:
                 return False
 
-            capabilities = control.definition.capabilities
+            cap_flags = control._cap_flags
 
-            if not capabilities.supports_feedback:
+            if not cap_flags & CAP_FEEDBACK:
                 return False
 
-            if "value" in kwargs and not capabilities.supports_value_setting:
+            if "value" in kwargs and not cap_flags & CAP_VALUE_SETTING:
                 return False
 
             if "color" in kwargs:
-                if not capabilities.supports_color:
+                if not cap_flags & CAP_COLOR:
                     return False
-                if not self._state.validate_color(control_id, kwargs["color"]):
+                if control._palette_set is not None and kwargs["color"] not in control._palette_set:
                     return False
 
             return True
@@ -539,6 +706,7 @@ class Controller:
     def set_states(
         self,
         updates: list[tuple[str, dict]],
+        skip_unchanged: bool = False,
     ) -> None:
         """
         Set multiple control states in a batch (sends hardware feedback).
@@ -550,6 +718,11 @@ class Controller:
         Args:
             updates: List of (control_id, state_dict) tuples.
                      Each state_dict can contain: is_on, color, led_mode, value
+            skip_unchanged: If True, drop updates whose is_on, value, color and
+                     led_mode keys all match the last state sent to the control,
+                     so no MIDI is sent for them. Only controls whose LEDs the
+                     library drives (requires_feedback) have a record to compare
+                     against; updates with none of those keys are always sent.
 
         Raises:
             RuntimeError: If not connected
@@ -567,77 +740,85 @@ class Controller:
         if not updates:
             return
 
+        state = self._state
+        get_control = state.get_control
+
+        # In permissive mode, skipped controls are grouped by (capability, control type)
+        # and each group is logged once after the batch
+        unsupported: dict[tuple[str, ControlType], list[str]] = {}
+        handle_unsupported = self._collect_unsupported
+
         # Validate all controls first (fail fast)
         validated_updates: list[tuple[str, dict]] = []
+        validated_controls: list[Control] = []
         for control_id, kwargs in updates:
-            control = self._state.get_control(control_id)
+            control = get_control(control_id)
             if not control:
                 raise ValueError(f"Unknown control: {control_id}")
 
-            capabilities = control.definition.capabilities
+            cap_flags = control._cap_flags
 
             # Check feedback support
-            if not capabilities.supports_feedback:
-                self._handle_unsupported_operation(f"Control '{control_id}' does not support feedback")
+            if not cap_flags & CAP_FEEDBACK:
+                handle_unsupported(unsupported, control, "feedback")
                 continue
 
             # Validate color
             if "color" in kwargs:
-                if not capabilities.supports_color:
-                    self._handle_unsupported_operation(f"Control '{control_id}' does not support color")
+                if not cap_flags & CAP_COLOR:
+                    handle_unsupported(unsupported, control, "color")
                     continue
-                if not self._state.validate_color(control_id, kwargs["color"]):
-                    self._handle_unsupported_operation(f"Color '{kwargs['color']}' not valid for '{control_id}'")
+                if control._palette_set is not None and kwargs["color"] not in control._palette_set:
+                    handle_unsupported(unsupported, control, f"color '{kwargs['color']}'")
                     continue
 
             # Validate value setting
-            if "value" in kwargs and not capabilities.supports_value_setting:
-                self._handle_unsupported_operation(f"Control '{control_id}' does not support value setting")
+            if "value" in kwargs and not cap_flags & CAP_VALUE_SETTING:
+                handle_unsupported(unsupported, control, "value setting")
                 continue
 
-            # Add definition LED mode based on is_on state
-            state_dict = dict(kwargs)
-            if "definition_led_mode" not in state_dict:
-                is_on = state_dict.get("is_on", False)
-                state_dict["definition_led_mode"] = (
-                    control.definition.on_led_mode if is_on else control.definition.off_led_mode
-                )
+            # Drop no-op updates: compared against what the hardware was last sent,
+            # since set_state() changes the LED without changing control state
+            if skip_unchanged:
+                last_sent = self._last_sent.get(control_id)
+                compared = [key for key in _COMPARED_STATE_FIELDS if key in kwargs]
+                if (
+                    last_sent is not None
+                    and compared
+                    and all(key in last_sent and kwargs[key] == last_sent[key] for key in compared)
+                ):
+                    continue
+
+            # Add definition LED mode based on is_on state (copy only when needed)
+            if "definition_led_mode" in kwargs:
+                state_dict = kwargs
+            else:
+                state_dict = {
+                    **kwargs,
+                    "definition_led_mode": control._led_modes[1 if kwargs.get("is_on") else 0],
+                }
 
             validated_updates.append((control_id, state_dict))
+            validated_controls.append(control)
+
+        for (capability, control_type), control_ids in unsupported.items():
+            logger.warning(
+                "%d %s control(s) do not support %s, skipped: %s",
+                len(control_ids),
+                control_type.value,
+                capability,
+                ", ".join(control_ids),
+            )
 
         if not validated_updates or not self._plugin:
             return
 
-        # Call plugin's batch method for optimized handling
-        result = self._plugin.translate_feedback_batch(validated_updates)
-
-        # Send messages with timing from plugin or default
-        default_delay = self._state.capabilities.feedback_message_delay
-        for i, msg in enumerate(result.messages):
-            self._send_message(msg)
-            # Use per-message delay if provided, otherwise default
-            delay = result.delays[i] if result.delays is not None and i < len(result.delays) else default_delay
-            if delay > 0:
-                time.sleep(delay)
+        self._send_feedback_batch(validated_updates, validated_controls)
 
         # Update internal control states to match what we sent to hardware.
         # This ensures auto-feedback (triggered by physical pad press) uses
         # the correct color/led_mode instead of stale default values.
-        for control_id, state_dict in validated_updates:
-            control = self._state.get_control(control_id)
-            if control:
-                current_state = control._state
-                new_state = ControlState(
-                    control_id=control_id,
-                    is_discovered=current_state.is_discovered,
-                    first_discovered_at=current_state.first_discovered_at,
-                    value=state_dict.get("value", current_state.value),
-                    normalized_value=current_state.normalized_value,
-                    is_on=state_dict.get("is_on", current_state.is_on),
-                    color=state_dict.get("color", current_state.color),
-                    led_mode=state_dict.get("led_mode", current_state.led_mode),
-                )
-                self._state.set_control_state(control_id, new_state)
+        state.apply_partial_updates(validated_updates)
 
     # Bank management
 
@@ -653,7 +834,8 @@ class Controller:
             still correctly identify controls by their full ID (pad_1@bank_2),
             but cannot tell you which bank is currently active.
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
         return self._state.get_active_bank(control_type)
 
     def set_active_bank(self, control_type: ControlType, bank_id: str) -> None:
@@ -667,7 +849,8 @@ class Controller:
         Note:
             Silent no-op if bank tracking not supported.
         """
-        self._ensure_connected()
+        if not self._connected:
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
         self._state.set_active_bank(control_type, bank_id)
 
     # Callback registration
@@ -749,7 +932,48 @@ class Controller:
         if not self._midi:
             return 0
 
-        return self._midi.process_pending_messages()
+        count = self._midi.process_pending_messages()
+
+        if self._pending_continuous and time.monotonic() - self._last_flush >= self._coalesce_interval:
+            self._flush_continuous()
+
+        if self._pending_feedback:
+            self.flush_feedback()
+
+        return count
+
+    def flush_feedback(self) -> None:
+        """
+        Send set_state() updates queued by auto_batch as a single feedback batch.
+
+        Like unbatched set_state(), this only sends feedback and leaves control
+        state unchanged. Called automatically by process_events() and
+        disconnect(). Does nothing if no updates are queued.
+        """
+        if not self._pending_feedback:
+            return
+
+        with self._pending_feedback_lock:
+            pending = self._pending_feedback
+            self._pending_feedback = {}
+        if not pending or not self._plugin:
+            return
+
+        # Queued updates were validated by set_state(); only redundancy is checked here
+        get_control = self._state.get_control
+        updates: list[tuple[str, dict]] = []
+        controls: list[Control] = []
+        for control_id, kwargs in pending.items():
+            control = get_control(control_id)
+            if "definition_led_mode" not in kwargs:
+                kwargs["definition_led_mode"] = control._led_modes[1 if kwargs.get("is_on") else 0]
+            if self._is_redundant(control, kwargs):
+                continue
+            updates.append((control_id, kwargs))
+            controls.append(control)
+
+        if updates:
+            self._send_feedback_batch(updates, controls)
 
     # Context manager support
 
@@ -769,91 +993,181 @@ class Controller:
     def _ensure_connected(self) -> None:
         """Raise error if not connected."""
         if not self._connected:
-            raise RuntimeError("Controller not connected. Call connect() first.")
+            raise RuntimeError(_NOT_CONNECTED_MESSAGE)
+
+    def _raise_capability_error(self, message: str) -> None:
+        """Handle unsupported operation in strict mode."""
+        raise CapabilityError(message)
+
+    def _warn_capability(self, message: str) -> None:
+        """Handle unsupported operation in permissive mode."""
+        logger.warning(message)
 
-    def _handle_unsupported_operation(self, message: str) -> None:
-        """Handle unsupported operation based on strict_mode."""
+    def _collect_unsupported(
+        self,
+        unsupported: dict[tuple[str, ControlType], list[str]],
+        control: Control,
+        capability: str,
+    ) -> None:
+        """Raise for an unsupported batch update in strict mode, else record it under its group."""
         if self._strict_mode:
-            raise CapabilityError(message)
-        else:
-            logger.warning(message)
+            raise CapabilityError(f"Control '{control._control_id}' does not support {capability}")
+        unsupported.setdefault((capability, control.definition.control_type), []).append(control._control_id)
+
+    def _validate_config_for_plugin(self) -> None:
+        """Validate the controller configuration against the resolved plugin."""
+        config = self._controller_config
+        if not config:
+            return
+
+        # Validate bank configurations against plugin constraints
+        if config.banks:
+            for bank_id, bank_config in config.banks.items():
+                self._plugin.validate_bank_config(bank_id, bank_config, self._strict_mode)
+
+        # Validate configured control types against plugin capabilities up front,
+        # keeping the definitions so connect() does not ask the plugin again
+        self._control_defs = tuple(self._plugin.get_control_definitions())
+        self._config_resolver.precheck(self._control_defs)
 
-    def _create_control(self, definition: ControlDefinition) -> Control:
+    def _validate_led_mode(
+        self,
+        definition: ControlDefinition,
+        mode_name: str,
+        mode_value: Optional[LEDMode],
+    ) -> Optional[LEDMode]:
+        """
+        Check a configured LED mode against the control's capabilities.
+
+        Args:
+            definition: Control definition
+            mode_name: Config field name, used in the warning/error message
+            mode_value: Configured LED mode, or None
+
+        Returns:
+            The LED mode if supported, None if it was rejected
+        """
+        if mode_value is None:
+            return None
+
+        animation_type = mode_value.animation_type
+        supported_animation_types = definition.capabilities.supported_animation_types
+
+        # If supported_led_modes is None, only "solid" is implicitly supported
+        if supported_animation_types is None:
+            if animation_type is LEDAnimationType.SOLID:
+                return mode_value
+            self._handle_unsupported_operation(
+                f"Control '{definition.control_id}' does not support LED mode "
+                f"'{animation_type.value}' for {mode_name}. Only 'solid' is supported.",
+            )
+            return None
+
+        # Compare LEDMode.animation_type to supported modes
+        if animation_type in supported_animation_types:
+            return mode_value
+        self._handle_unsupported_operation(
+            f"Control '{definition.control_id}' does not support LED mode "
+            f"'{animation_type.value}' for {mode_name}. Supported modes: {[m.value for m in supported_animation_types]}",
+        )
+        return None
+
+    def _create_control(self, definition: ControlDefinition, resolved: ResolvedControl) -> Control:
         """
         Create Control instance from definition.
 
-        Uses configuration resolver to determine actual control type, colors, and LED modes.
+        Applies the type, colors, and LED modes resolved from configuration.
 
         Args:
             definition: Control definition
+            resolved: Resolved configuration for this control (see ControlConfigResolver.build_index)
 
         Returns:
             Control instance
         """
-        # Resolve type, colors, and LED modes from config
-        actual_type, on_color, off_color, on_led_mode, off_led_mode = self._config_resolver.resolve_config(
-            definition.control_id,
-            definition,
-        )
+        actual_type = resolved.type
+        on_color = resolved.on_color
+        off_color = resolved.off_color
+        on_led_mode = resolved.on_led_mode
+        off_led_mode = resolved.off_led_mode
 
         # Validate LED modes against capabilities
-        supported_modes = definition.capabilities.supported_led_modes
-        for mode_name, mode_value in [("on_led_mode", on_led_mode), ("off_led_mode", off_led_mode)]:
-            if mode_value is not None:
-                # If supported_led_modes is None, only "solid" is implicitly supported
-                if supported_modes is None:
-                    if mode_value.animation_type != LEDAnimationType.SOLID:
-                        self._handle_unsupported_operation(
-                            f"Control '{definition.control_id}' does not support LED mode "
-                            f"'{mode_value.animation_type.value}' for {mode_name}. Only 'solid' is supported.",
-                        )
-                        if mode_name == "on_led_mode":
-                            on_led_mode = None
-                        else:
-                            off_led_mode = None
-                else:
-                    # Compare LEDMode.animation_type to supported modes
-                    supported_animation_types = {mode.animation_type for mode in supported_modes}
-                    if mode_value.animation_type not in supported_animation_types:
-                        self._handle_unsupported_operation(
-                            f"Control '{definition.control_id}' does not support LED mode "
-                            f"'{mode_value.animation_type.value}' for {mode_name}. Supported modes: {[m.value for m in supported_animation_types]}",
-                        )
-                        if mode_name == "on_led_mode":
-                            on_led_mode = None
-                        else:
-                            off_led_mode = None
+        on_led_mode = self._validate_led_mode(definition, "on_led_mode", on_led_mode)
+        off_led_mode = self._validate_led_mode(definition, "off_led_mode", off_led_mode)
 
         # Create control with resolved type, colors, and LED modes
-        # Clear type_modes since it's no longer needed after resolution
-        resolved_definition = definition.model_copy(
-            update={
-                "control_type": actual_type,
-                "type_modes": None,
-                "on_color": on_color,
-                "off_color": off_color,
-                "on_led_mode": on_led_mode,
-                "off_led_mode": off_led_mode,
-            },
-        )
-
-        if actual_type == ControlType.TOGGLE:
-            control = ToggleControl(resolved_definition)
-        elif actual_type == ControlType.MOMENTARY:
-            control = MomentaryControl(resolved_definition)
-        elif actual_type == ControlType.CONTINUOUS:
-            control = ContinuousControl(resolved_definition)
+        # Clear type_modes since it's no longer needed after resolution.
+        # Skip the copy when resolution leaves the definition unchanged.
+        if (
+            definition.type_modes is None
+            and definition.control_type is actual_type
+            and definition.on_color == on_color
+            and definition.off_color == off_color
+            and definition.on_led_mode == on_led_mode
+            and definition.off_led_mode == off_led_mode
+        ):
+            resolved_definition = definition
         else:
+            resolved_definition = definition.model_copy(
+                update={
+                    "control_type": actual_type,
+                    "type_modes": None,
+                    "on_color": on_color,
+                    "off_color": off_color,
+                    "on_led_mode": on_led_mode,
+                    "off_led_mode": off_led_mode,
+                },
+            )
+
+        control_cls = self._CTRL_CLASSES.get(actual_type)
+        if control_cls is None:
             raise ValueError(f"Unknown control type: {actual_type}")
 
-        return control
+        return control_cls(resolved_definition)
 
-    def _send_message(self, msg: mido.Message) -> None:
-        """Send MIDI message (internal)."""
-        if self._midi:
-            self._midi.send_message(msg)
+    def _send_feedback(
+        self,
+        messages: list["mido.Message"],
+        delay: float = 0.0,
+        delays: Optional[list[float]] = None,
+    ) -> None:
+        """
+        Send feedback messages, in bulk when the device needs no pacing (internal).
+
+        Pacing is done by MIDIInterface.send_with_delays().
 
-    def _apply_bank_leds(self, bank_id: str) -> None:
+        Args:
+            messages: MIDI messages to send, in order
+            delay: Minimum seconds between message sends (0 sends back-to-back)
+            delays: Optional per-message delays overriding delay (e.g., from
+                translate_feedback_batch()); missing entries fall back to delay
+        """
+        if messages:
+            self._send_paced(messages, delays, delay)
+
+    def _send_feedback_batch(self, updates: list[tuple[str, dict]], controls: list[Control]) -> None:
+        """Translate validated updates with the plugin's batch method, send them and record them."""
+        # Call plugin's batch method for optimized handling
+        result = self._plugin.translate_feedback_batch(updates)
+
+        # Send messages with timing from plugin (per-message delays) or default
+        self._send_feedback(result.messages, self._feedback_delay, result.delays)
+
+        for control, (_, state_dict) in zip(controls, updates):
+            self._record_sent(control, state_dict)
+
+    def _is_redundant(self, control: Control, state_dict: dict) -> bool:
+        """Check if feedback would repeat the last state sent to a library-driven LED."""
+        if not control._cap_flags & CAP_REQUIRES_FEEDBACK:
+            return False
+        return self._last_sent.get(control._control_id) == state_dict
+
+    def _record_sent(self, control: Control, state_dict: dict) -> None:
+        """Remember feedback state sent to a library-driven LED."""
+        if control._cap_flags & CAP_REQUIRES_FEEDBACK:
+            self._last_sent[control._control_id] = dict(state_dict)
+
+    def _apply_bank_leds(self, bank_id: str, force: bool = True) -> None:
         """
         Apply LED colors for all controls in a bank.
 
@@ -862,45 +1176,52 @@ class Controller:
 
         Args:
             bank_id: Bank to apply LED colors for
+            force: If False, skip controls whose LED state was already sent
         """
         if not self._plugin or not self._state:
             return
 
-        for control_def in self._plugin.get_control_definitions():
-            # Only process controls in the specified bank
-            if control_def.bank_id != bank_id:
-                continue
-
-            control = self._state.get_control(control_def.control_id)
-            if not control:
-                continue
-
-            # Only send feedback for controls with feedback capability
-            if not control.definition.capabilities.supports_feedback:
-                continue
-
+        translate_feedback = self._plugin.translate_feedback
+
+        # One state dict reused for every control (plugins don't retain it, _record_sent copies it).
+        # It carries the same keys as the other feedback paths so force=False can match their records.
+        state_dict: dict = {
+            "is_on": False,
+            "value": 0,
+            "color": None,
+            "normalized_value": None,
+            "led_mode": None,
+            "definition_led_mode": None,
+        }
+
+        # Entries are pre-filtered at connect time to feedback-capable controls with a color
+        batch: list["mido.Message"] = []
+        for control in self._feedback_controls_by_bank.get(bank_id, ()):
             # Determine color based on current state
             state = control.state
-            color = control.definition.on_color if state.is_on else control.definition.off_color
+            index = 1 if state.is_on else 0
+            color = control._colors[index]
 
             if not color:
                 continue
 
-            # Build state dict and send feedback
-            state_dict = {
-                "is_on": state.is_on if state.is_on is not None else False,
-                "value": state.value if state.value is not None else 0,
-                "color": color,
-                "normalized_value": state.normalized_value,
-            }
+            # Fill state dict and send feedback
+            state_dict["is_on"] = state.is_on if state.is_on is not None else False
+            state_dict["value"] = state.value if state.value is not None else 0
+            state_dict["color"] = color
+            state_dict["normalized_value"] = state.normalized_value
+            state_dict["led_mode"] = state_dict["definition_led_mode"] = control._led_modes[index]
+            if not force and self._is_redundant(control, state_dict):
+                continue
 
-            messages = self._plugin.translate_feedback(control_def.control_id, state_dict)
-            for msg in messages:
-                self._send_message(msg)
+            batch.extend(translate_feedback(control._control_id, state_dict))
+            self._record_sent(control, state_dict)
 
-        logger.debug(f"Applied LED colors for bank: {bank_id}")
+        # Inter-message delay is applied if device needs it (e.g., APC mini MK2)
+        self._send_feedback(batch, self._feedback_delay)
+        logger.debug("Applied LED colors for bank: %s", bank_id)
 
-    def _on_midi_message(self, msg: mido.Message) -> None:
+    def _on_midi_message(self, msg: "mido.Message") -> None:
         """
         Handle incoming MIDI message.
 
@@ -909,87 +1230,146 @@ class Controller:
         Args:
             msg: Incoming MIDI message
         """
-        if not self._plugin or not self._state:
+        plugin = self._plugin
+        state = self._state
+        if not plugin or not state:
             return
 
         # Check for bank switch
-        bank_id = self._plugin.translate_bank_switch(msg)
+        bank_id = plugin.translate_bank_switch(msg)
         if bank_id:
             # Determine control type from message (simplified)
             # In practice, plugin should provide this information
             control_type = ControlType.TOGGLE  # Default
-            self._state.set_active_bank(control_type, bank_id)
+            # Repeated reports of the already-active bank (noisy controllers) skip the
+            # state update and LED repaint, but callbacks still see every reported switch
+            if state.get_active_bank(control_type) != bank_id:
+                state.set_active_bank(control_type, bank_id)
+                self._apply_bank_leds(bank_id, force=False)
             self._callbacks.on_bank_change(control_type, bank_id)
             return
 
         # Translate MIDI to control with signal type
-        result = self._plugin.translate_input(msg)
+        result = plugin.translate_input(msg)
         if not result:
-            logger.debug(f"No mapping found for MIDI message: {msg}")
+            logger.debug("No mapping found for MIDI message: %s", msg)
             return
 
         control_id, value, signal_type = result
 
-        # Get control for plugin hook and callbacks
-        control = self._state.get_control(control_id)
+        # Get control for plugin hook and callbacks (direct dict lookup, see get_control)
+        control = state._controls.get(control_id)
         if not control:
-            logger.debug(f"Control not found: {control_id}")
+            logger.debug("Control not found: %s", control_id)
             return
+        definition = control.definition
 
         # Update state - allow plugin to compute state for hardware-managed controls
         try:
             # Check if plugin wants to compute state itself
-            plugin_state, trigger_callback = self._plugin.compute_control_state(
+            plugin_state, trigger_callback = plugin.compute_control_state(
                 control_id=control_id,
                 value=value,
                 signal_type=signal_type,
                 current_state=control.state,
-                control_definition=control.definition,
+                control_definition=definition,
             )
 
             if plugin_state is not None:
                 # Plugin provided state - use it directly
-                new_state = self._state.set_control_state(control_id, plugin_state)
+                new_state = state.set_control_state(control_id, plugin_state)
             else:
                 # Use default control type behavior
-                new_state = self._state.update_state(control_id, value)
-
-            # Fire callbacks with control type and category
-            if trigger_callback:
-                control_type = control.definition.control_type
-                category = control.definition.category
-                self._callbacks.on_control_change(control_id, new_state, control_type, signal_type, category)
-
-            # Auto-send feedback if control REQUIRES it (hardware doesn't manage LEDs)
-            # Works for both color-based (pads) and on/off-based (buttons) controls
-            logger.debug(
-                f"Auto-feedback check for {control_id}: requires_feedback={control.definition.capabilities.requires_feedback}",
-            )
-            if control.definition.capabilities.requires_feedback:
-                # Convert ControlState to dict for translate_feedback
-                # definition_led_mode is based on is_on state (on_led_mode or off_led_mode)
-                definition_led_mode = (
-                    control.definition.on_led_mode if new_state.is_on else control.definition.off_led_mode
-                )
-                state_dict = {
-                    "is_on": new_state.is_on,
-                    "value": new_state.value,
-                    "color": new_state.color,
-                    "normalized_value": new_state.normalized_value,
-                    "led_mode": new_state.led_mode,
-                    "definition_led_mode": definition_led_mode,
-                }
-                messages = self._plugin.translate_feedback(control_id, state_dict)
-                feedback_delay = self._state.capabilities.feedback_message_delay
-                for feedback_msg in messages:
-                    self._send_message(feedback_msg)
-                    # Add inter-message delay if device needs it (e.g., Note On → SysEx)
-                    if feedback_delay > 0:
-                        time.sleep(feedback_delay)
+                new_state = state.update_state(control_id, value)
+
+            # Defer continuous controls to the next flush, keeping only the latest state
+            if self._coalesce_continuous and definition.control_type is ControlType.CONTINUOUS:
+                key = (control_id, signal_type)
+                pending = self._pending_continuous.get(key)
+                trigger_callback = trigger_callback or (pending is not None and pending[2])
+                self._pending_continuous[key] = (control, new_state, trigger_callback)
+                return
+
+            self._dispatch_change(control, new_state, signal_type, trigger_callback)
 
         except ValueError as e:
             logger.error(f"Error updating state: {e}")
 
+    def _flush_continuous(self) -> None:
+        """Dispatch coalesced continuous-control changes (latest state per control and signal)."""
+        pending = self._pending_continuous
+        self._pending_continuous = {}
+        self._last_flush = time.monotonic()
+
+        for (_, signal_type), (control, new_state, trigger_callback) in pending.items():
+            try:
+                self._dispatch_change(control, new_state, signal_type, trigger_callback)
+            except ValueError as e:
+                logger.error(f"Error updating state: {e}")
+
+    def _dispatch_change(
+        self,
+        control: Control,
+        new_state: ControlState,
+        signal_type: str,
+        trigger_callback: bool,
+    ) -> None:
+        """
+        Fire callbacks and auto-feedback for a control state change.
+
+        Args:
+            control: Control that changed
+            new_state: Its new state
+            signal_type: Signal type from MIDI translation
+            trigger_callback: Whether user callbacks should fire
+        """
+        definition = control.definition
+        control_id = control._control_id
+
+        # Fire callbacks with control type and category
+        if trigger_callback:
+            self._callbacks.on_control_change(
+                control_id,
+                new_state,
+                definition.control_type,
+                signal_type,
+                definition.category,
+            )
+
+        # Auto-send feedback if control REQUIRES it (hardware doesn't manage LEDs)
+        # Works for both color-based (pads) and on/off-based (buttons) controls
+        requires_feedback = bool(control._cap_flags & CAP_REQUIRES_FEEDBACK)
+        logger.debug("Auto-feedback check for %s: requires_feedback=%s", control_id, requires_feedback)
+        if requires_feedback:
+            # Convert ControlState to dict for translate_feedback, reusing one
+            # dict (plugins only read it during the call; _record_sent copies it)
+            # definition_led_mode is based on is_on state (on_led_mode or off_led_mode)
+            is_on = new_state.is_on
+            state_dict = self._fb_scratch
+            state_dict["is_on"] = is_on
+            state_dict["value"] = new_state.value
+            state_dict["color"] = new_state.color
+            state_dict["normalized_value"] = new_state.normalized_value
+            state_dict["led_mode"] = new_state.led_mode
+            state_dict["definition_led_mode"] = control._led_modes[1 if is_on else 0]
+            # requires_feedback is known here, so dedupe/record inline (see _is_redundant/_record_sent)
+            last_sent = self._last_sent
+            if last_sent.get(control_id) == state_dict:
+                return
+            messages = self._translate_feedback(control_id, state_dict)
+            # Inter-message delay is applied if device needs it (e.g., Note On → SysEx)
+            if messages:
+                self._send_paced(messages, None, self._feedback_delay)
+            last_sent[control_id] = dict(state_dict)
+
+    def _debug_full_state(
+        self,
+    ) -> tuple[str, Optional["DebugLayout"], dict[str, ControlState], dict[str, ControlDefinition]]:
+        """Build the full-state snapshot sent to newly connected debug clients."""
+        states = self._state.get_all_states()
+        definitions = self._state.get_all_definitions()  # Get definitions with resolved colors
+        return self._plugin.name, self._plugin.get_debug_layout(), states, definitions
+
     def _on_state_change_for_debug(self, control_id: str, state: ControlState) -> None:
         """
         Callback to broadcast state changes to debug clients.
@@ -998,5 +1378,7 @@ class Controller:
             control_id: ID of the control that changed
             state: New state of the control
         """
-        if self._broadcaster:
-            self._broadcaster.broadcast_state_change(control_id, state)
+        # Nothing to serialize when no debug client is connected (the common case)
+        broadcaster = self._broadcaster
+        if broadcaster and broadcaster.has_clients:
+            broadcaster.broadcast_state_change(control_id, state)
@@ -6,12 +6,14 @@ and their associated state models using Pydantic for validation and serializatio
 """
 
 import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, computed_field, field_validator, model_validator
 
 
 class ControlType(str, Enum):
@@ -22,6 +24,13 @@ class ControlType(str, Enum):
     CONTINUOUS = "continuous"  # Range-based values (e.g., knobs, faders)
 
 
+# Capability bit flags, precomputed per Control for fast checks on hot paths
+CAP_FEEDBACK = 1
+CAP_VALUE_SETTING = 2
+CAP_COLOR = 4
+CAP_REQUIRES_FEEDBACK = 8
+
+
 class LEDAnimationType(str, Enum):
     """Three LED animation types for MIDI controllers."""
 
@@ -36,10 +45,45 @@ class LEDMode(BaseModel):
     animation_type: LEDAnimationType = LEDAnimationType.SOLID
     frequency: Optional[int] = None
 
+    model_config = {"frozen": True}  # Immutable, so instances can be shared (see get())
+
     def __hash__(self):
         """Make hashable for use in sets and as dict keys."""
         return hash((self.animation_type, self.frequency))
 
+    @classmethod
+    def get(
+        cls,
+        animation_type: LEDAnimationType = LEDAnimationType.SOLID,
+        frequency: Optional[int] = None,
+    ) -> "LEDMode":
+        """
+        Get the shared LEDMode instance for an animation type and frequency.
+
+        Plugins and configs use a handful of modes for every control, so
+        instances are interned instead of constructed per control. Shared
+        instances also make state comparisons hit the identity fast path.
+
+        Args:
+            animation_type: LED animation type
+            frequency: Optional frequency in pulses per second
+
+        Returns:
+            Interned LEDMode
+        """
+        key = (animation_type, frequency)
+        mode = _LED_MODE_CACHE.get(key)
+        if mode is None:
+            mode = _LED_MODE_CACHE[key] = LEDMode(animation_type=animation_type, frequency=frequency)
+        return mode
+
+
+# Interned LEDMode instances, keyed by (animation_type, frequency)
+_LED_MODE_CACHE: dict[tuple[LEDAnimationType, Optional[int]], LEDMode] = {}
+
+# Parses non-datetime ControlState timestamps (e.g. ISO strings from JSON)
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
 
 class ControlCapabilities(BaseModel):
     """
@@ -50,6 +94,8 @@ class ControlCapabilities(BaseModel):
     but have limited or no ability to receive state updates.
     """
 
+    model_config = {"frozen": True}  # Built once at plugin load and shared, never mutated
+
     # Can receive feedback at all? (capability exists for API use)
     supports_feedback: bool = False
 
@@ -75,6 +121,13 @@ class ControlCapabilities(BaseModel):
     # Does control report initial state or require discovery?
     requires_discovery: bool = True  # True for most knobs/faders
 
+    @cached_property
+    def supported_animation_types(self) -> Optional[frozenset[LEDAnimationType]]:
+        """Animation types of supported_led_modes as a frozenset (None if only solid is supported)."""
+        if self.supported_led_modes is None:
+            return None
+        return frozenset(mode.animation_type for mode in self.supported_led_modes)
+
 
 class ControlTypeModes(BaseModel):
     """
@@ -84,6 +137,8 @@ class ControlTypeModes(BaseModel):
     Configurable controllers like LPD8 support multiple types.
     """
 
+    model_config = {"frozen": True}  # Built once at plugin load and shared, never mutated
+
     supported_types: list[ControlType]  # e.g., [TOGGLE, MOMENTARY]
     default_type: ControlType  # Plugin's recommended default
     requires_hardware_sync: bool = False  # Does mode change require MIDI/SysEx?
@@ -102,6 +157,11 @@ class ControlTypeModes(BaseModel):
             raise ValueError(f"default_type {v} must be in supported_types")
         return v
 
+    @cached_property
+    def supported_type_set(self) -> frozenset[ControlType]:
+        """Supported types as a frozenset for constant-time membership checks."""
+        return frozenset(self.supported_types)
+
 
 class ControllerCapabilities(BaseModel):
     """
@@ -110,6 +170,8 @@ class ControllerCapabilities(BaseModel):
     Defines capabilities that apply to the entire controller, not individual controls.
     """
 
+    model_config = {"frozen": True}  # Built once at plugin load and shared, never mutated
+
     # Does controller report bank changes via MIDI? (most do NOT)
     supports_bank_feedback: bool = False
 
@@ -125,6 +187,10 @@ class ControllerCapabilities(BaseModel):
     # Does controller support persistent configuration via configure_programs()?
     supports_persistent_configuration: bool = False
 
+    # Delay (seconds) to wait after configure_programs() before sending LED updates.
+    # Gives the device time to process the configuration.
+    post_configure_delay: float = Field(default=0.2, ge=0.0)
+
     # Delay (seconds) to wait after init() before sending initial LED states.
     # Needed for devices with async initialization (e.g., APC mini intro message).
     post_init_delay: float = Field(default=0.0, ge=0.0)
@@ -142,6 +208,8 @@ class BankDefinition(BaseModel):
     to access more controls than physical hardware.
     """
 
+    model_config = {"frozen": True}  # Built once at plugin load and shared, never mutated
+
     bank_id: str  # e.g., "bank_1", "bank_2"
     control_type: ControlType  # Which control type this bank is for
     display_name: Optional[str] = None  # User-friendly name
@@ -154,6 +222,8 @@ class ControlDefinition(BaseModel):
     Defines the control's type, capabilities, and optional bank membership.
     """
 
+    model_config = {"frozen": True}  # Built once at plugin load and shared, never mutated
+
     control_id: str  # e.g., "pad_1", "fader_1", "pad_1@bank_1"
     control_type: ControlType
     category: Optional[str] = None  # e.g., "pad", "transport", "navigation", "mode", "encoder"
@@ -199,7 +269,12 @@ class ControlState(BaseModel):
     """
 
     control_id: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    # Wall-clock time in nanoseconds; cheaper to take per MIDI event than a datetime.
+    # Also accepts a datetime ``timestamp`` (the field it replaced); timestamp_ns wins if both are given.
+    timestamp_ns: int = Field(
+        default_factory=time.time_ns,
+        validation_alias=AliasChoices("timestamp_ns", "timestamp"),
+    )
 
     # Discovery tracking
     is_discovered: bool = False
@@ -214,6 +289,23 @@ class ControlState(BaseModel):
 
     model_config = {"frozen": True}  # Immutability
 
+    @field_validator("timestamp_ns", mode="before")
+    @classmethod
+    def convert_timestamp(cls, v):
+        """Convert a datetime (or datetime string) passed as ``timestamp`` to nanoseconds."""
+        # Only runs for explicitly passed values; the default factory skips validation
+        if isinstance(v, int):
+            return v
+        if not isinstance(v, datetime):
+            v = _DATETIME_ADAPTER.validate_python(v)
+        return int(v.timestamp()) * 1_000_000_000 + v.microsecond * 1000
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def timestamp(self) -> datetime:
+        """Time of this snapshot as a datetime (converted from timestamp_ns on access)."""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)  # noqa: DTZ006 - naive local time, like datetime.now()
+
 
 class CapabilityError(Exception):
     """
@@ -234,6 +326,18 @@ class Control(ABC):
     type-specific state computation logic.
     """
 
+    # Slotted: controls are created once per connect and read on every MIDI event
+    __slots__ = (
+        "_definition",
+        "_control_id",
+        "_state",
+        "_lock",
+        "_cap_flags",
+        "_palette_set",
+        "_colors",
+        "_led_modes",
+    )
+
     def __init__(self, definition: ControlDefinition):
         """
         Initialize control with its definition.
@@ -242,8 +346,25 @@ class Control(ABC):
             definition: Control metadata including capabilities
         """
         self._definition = definition
+        self._control_id = definition.control_id
         self._state = ControlState(control_id=definition.control_id, is_discovered=False)
-        self._lock = threading.RLock()
+        # Plain Lock: update_from_midi() never re-enters it
+        self._lock = threading.Lock()
+
+        # Precomputed capability checks (definition is immutable)
+        capabilities = definition.capabilities
+        self._cap_flags = (
+            (CAP_FEEDBACK if capabilities.supports_feedback else 0)
+            | (CAP_VALUE_SETTING if capabilities.supports_value_setting else 0)
+            | (CAP_COLOR if capabilities.supports_color else 0)
+            | (CAP_REQUIRES_FEEDBACK if capabilities.requires_feedback else 0)
+        )
+        palette = capabilities.color_palette
+        self._palette_set: Optional[frozenset[str]] = frozenset(palette) if palette is not None else None
+
+        # (off, on) colors and LED modes, indexed by is_on
+        self._colors = (definition.off_color, definition.on_color)
+        self._led_modes = (definition.off_led_mode, definition.on_led_mode)
 
     @property
     def definition(self) -> ControlDefinition:
@@ -252,9 +373,8 @@ class Control(ABC):
 
     @property
     def state(self) -> ControlState:
-        """Get current state (thread-safe)."""
-        with self._lock:
-            return self._state
+        """Get current state (thread-safe: states are immutable and replaced atomically)."""
+        return self._state
 
     def update_from_midi(self, value: int, **kwargs) -> ControlState:
         """
@@ -265,21 +385,43 @@ class Control(ABC):
             **kwargs: Additional type-specific parameters (e.g., velocity, note)
 
         Returns:
-            New state snapshot
+            New state snapshot (the current one, unchanged, if the event was a no-op)
         """
         with self._lock:
-            # Track discovery
-            first_discovered_at = datetime.now() if not self._state.is_discovered else self._state.first_discovered_at
-
-            # Compute new state (subclass-specific)
+            # Compute new state (subclass-specific, already marked as discovered)
             new_state = self._compute_new_state(value, **kwargs)
+            if new_state is self._state:
+                return new_state
 
-            # Mark as discovered
-            self._state = new_state.model_copy(
-                update={"is_discovered": True, "first_discovered_at": first_discovered_at},
-            )
+            # Mark as discovered if the subclass built the state without _new_state()
+            if not new_state.is_discovered:
+                first_discovered_at = self._state.first_discovered_at or datetime.now()
+                new_state = new_state.model_copy(
+                    update={"is_discovered": True, "first_discovered_at": first_discovered_at},
+                )
+
+            self._state = new_state
+            return new_state
+
+    def _new_state(self, **fields) -> ControlState:
+        """
+        Build a discovered state snapshot for this control (called with lock held).
+
+        Fills in control_id and discovery tracking (the timestamp defaults) so the state is
+        constructed once per MIDI event instead of being copied afterwards.
 
-            return self._state
+        Args:
+            **fields: Type-specific state values (value, is_on, color, ...)
+
+        Returns:
+            New ControlState marked as discovered
+        """
+        return ControlState(
+            control_id=self._control_id,
+            is_discovered=True,
+            first_discovered_at=self._state.first_discovered_at or datetime.now(),
+            **fields,
+        )
 
     @abstractmethod
     def _compute_new_state(self, value: int, **kwargs) -> ControlState:
@@ -291,7 +433,7 @@ class Control(ABC):
             **kwargs: Additional parameters
 
         Returns:
-            New ControlState (without discovery tracking)
+            New ControlState, normally built with _new_state()
         """
         pass
 
@@ -303,6 +445,8 @@ class ToggleControl(Control):
     Toggles state on each press. Used for pads acting as switches.
     """
 
+    __slots__ = ()
+
     def __init__(self, definition: ControlDefinition):
         """Initialize toggle control with off state."""
         super().__init__(definition)
@@ -326,20 +470,32 @@ class ToggleControl(Control):
             value: MIDI velocity (0-127)
 
         Returns:
-            New state with toggled is_on and appropriate color
+            New state with toggled is_on and appropriate color, or the current
+            state object if the event would not change any of its fields
         """
+        state = self._state
+
         # Only toggle on press (velocity > 0), ignore release
-        new_is_on = not self._state.is_on if value > 0 else self._state.is_on
+        new_is_on = not state.is_on if value > 0 else state.is_on
 
         # Set color based on new state
-        color = self._definition.on_color if new_is_on else self._definition.off_color
+        index = 1 if new_is_on else 0
+        color = self._colors[index]
 
         # LED mode based on state (on_led_mode when ON, off_led_mode when OFF)
-        led_mode = self._definition.on_led_mode if new_is_on else self._definition.off_led_mode
-
-        return ControlState(
-            control_id=self._definition.control_id,
-            timestamp=datetime.now(),
+        led_mode = self._led_modes[index]
+
+        # Repeated release: reuse the current state instead of allocating an identical one
+        if (
+            state.is_discovered
+            and new_is_on == state.is_on
+            and value == state.value
+            and color == state.color
+            and led_mode == state.led_mode
+        ):
+            return state
+
+        return self._new_state(
             is_on=new_is_on,
             value=value,
             color=color,
@@ -355,6 +511,8 @@ class MomentaryControl(Control):
     LED lights up while pressed, turns off when released.
     """
 
+    __slots__ = ()
+
     def __init__(self, definition: ControlDefinition):
         """Initialize momentary control with off state."""
         super().__init__(definition)
@@ -381,12 +539,11 @@ class MomentaryControl(Control):
         """
         # Only trigger on press (velocity > 0)
         is_triggered = value > 0
-        color = self._definition.on_color if is_triggered else self._definition.off_color
-        led_mode = self._definition.on_led_mode if is_triggered else self._definition.off_led_mode
+        index = 1 if is_triggered else 0
+        color = self._colors[index]
+        led_mode = self._led_modes[index]
 
-        return ControlState(
-            control_id=self._definition.control_id,
-            timestamp=datetime.now(),
+        return self._new_state(
             value=value,
             is_on=is_triggered,  # Treat trigger as momentary "on"
             color=color,
@@ -402,6 +559,17 @@ class ContinuousControl(Control):
     Always requires discovery - initial position unknown until first movement.
     """
 
+    __slots__ = ("_min_value", "_value_range")
+
+    def __init__(self, definition: ControlDefinition):
+        """Initialize continuous control with its precomputed normalization constants."""
+        super().__init__(definition)
+        value_range = definition.max_value - definition.min_value
+        self._min_value = definition.min_value
+        # Divide (not multiply by the reciprocal) so endpoints normalize to exactly 0.0/1.0;
+        # an empty range divides by infinity, normalizing every value to 0.0
+        self._value_range = value_range if value_range > 0 else float("inf")
+
     def _compute_new_state(self, value: int, **kwargs) -> ControlState:
         """
         Update continuous control value.
@@ -413,13 +581,14 @@ class ContinuousControl(Control):
             New state with value and normalized_value
         """
         # Normalize to 0.0-1.0 range
-        value_range = self._definition.max_value - self._definition.min_value
-        normalized = (value - self._definition.min_value) / value_range if value_range > 0 else 0.0
-        normalized = max(0.0, min(1.0, normalized))  # Clamp to [0.0, 1.0]
-
-        return ControlState(
-            control_id=self._definition.control_id,
-            timestamp=datetime.now(),
+        normalized = (value - self._min_value) / self._value_range
+        # Clamp to [0.0, 1.0]
+        if normalized < 0.0:
+            normalized = 0.0
+        elif normalized > 1.0:
+            normalized = 1.0
+
+        return self._new_state(
             value=value,
             normalized_value=normalized,
         )
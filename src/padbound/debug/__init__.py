@@ -21,6 +21,9 @@ Usage:
     $ python -m padbound.debug.tui --url ws://127.0.0.1:8765
 """
 
+import importlib
+import importlib.util
+
 from padbound.debug.layout import (
     ControlPlacement,
     ControlWidget,
@@ -36,19 +39,22 @@ __all__ = [
     "LayoutSection",
 ]
 
+# Server and TUI components are imported on first access, so importing
+# padbound.debug.server (e.g. from Controller) does not pull in textual.
+_LAZY_EXPORTS = {
+    "StateBroadcaster": "padbound.debug.server",
+    "ControllerStateApp": "padbound.debug.tui",
+    "run_tui": "padbound.debug.tui",
+}
+
 # Conditionally export server and TUI components
 # These require websockets and textual dependencies
-try:
-    from padbound.debug.server import StateBroadcaster  # noqa: F401
-    from padbound.debug.tui import ControllerStateApp, run_tui  # noqa: F401
-
-    __all__.extend(
-        [
-            "StateBroadcaster",
-            "ControllerStateApp",
-            "run_tui",
-        ],
-    )
-except ImportError:
-    # websockets or textual not installed
-    pass
+if importlib.util.find_spec("websockets") and importlib.util.find_spec("textual"):
+    __all__.extend(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
@@ -33,8 +33,16 @@ class StateChangeMessage(BaseModel):
     state: ControlState
 
 
+class StateChangesMessage(BaseModel):
+    """Message carrying the latest state of every control that changed since the last broadcast."""
+
+    type: Literal["state_changes"] = "state_changes"
+    timestamp: datetime
+    states: dict[str, ControlState]
+
+
 # Discriminated union for parsing any incoming message
 DebugMessage = Annotated[
-    Union[FullStateMessage, StateChangeMessage],
+    Union[FullStateMessage, StateChangeMessage, StateChangesMessage],
     Field(discriminator="type"),
 ]
@@ -10,20 +10,44 @@ import asyncio
 import contextlib
 import threading
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from pydantic import BaseModel
 
 from padbound.logging_config import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from websockets.asyncio.server import Server, ServerConnection
 
     from padbound.controls import ControlDefinition, ControlState
     from padbound.debug.layout import DebugLayout
-    from padbound.debug.messages import FullStateMessage
 
 logger = get_logger(__name__)
 
 
+def _model_fields(obj: Any) -> dict[str, Any]:
+    """orjson default hook: serialize (already validated) pydantic models from their field values."""
+    if isinstance(obj, BaseModel):
+        # Computed fields (e.g. ControlState.timestamp) are part of the pydantic dump too
+        computed = type(obj).model_computed_fields
+        if computed:
+            return {**obj.__dict__, **{name: getattr(obj, name) for name in computed}}
+        return obj.__dict__
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Returns (plugin_name, layout, states, definitions) for the full-state message
+FullStateProvider = Callable[
+    [],
+    tuple[str, Optional["DebugLayout"], dict[str, "ControlState"], dict[str, "ControlDefinition"]],
+]
+
+
 class StateBroadcaster:
     """
     WebSocket server for broadcasting controller state changes.
@@ -33,6 +57,9 @@ class StateBroadcaster:
     Controller thread.
     """
 
+    # Seconds between coalesced state broadcasts (~60 Hz)
+    BROADCAST_INTERVAL = 1 / 60
+
     def __init__(self, host: str = "127.0.0.1", port: int = 8765):
         """
         Initialize the broadcaster.
@@ -48,10 +75,21 @@ class StateBroadcaster:
         self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
+        self._ready = threading.Event()  # Set by the server thread once it is listening (or failed)
+        # Guards only the cross-thread handoff of pending changes. _clients is
+        # touched only on the server loop (and in stop() after it has exited).
         self._lock = threading.Lock()
 
-        # Cached full state for new client connections
-        self._cached_full_state: Optional["FullStateMessage"] = None
+        # Serialized full state for new client connections, built lazily from the provider
+        self._cached_full_state_json: Optional[str] = None
+        self._full_state_provider: Optional[FullStateProvider] = None
+
+        # Latest state per changed control, waiting to be sent by the server thread.
+        # Guarded by _lock; intermediate states of fast controls are overwritten.
+        self._pending_changes: dict[str, "ControlState"] = {}
+        self._drain_scheduled = False
+        # The running drain task; the loop only holds a weak reference to tasks
+        self._drain_task: Optional[asyncio.Task] = None
 
     @property
     def host(self) -> str:
@@ -71,8 +109,12 @@ class StateBroadcaster:
     @property
     def client_count(self) -> int:
         """Get the number of connected clients."""
-        with self._lock:
-            return len(self._clients)
+        return len(self._clients)
+
+    @property
+    def has_clients(self) -> bool:
+        """Check if any client is connected (lock-free, for hot-path short-circuits)."""
+        return bool(self._clients)
 
     def start(self) -> None:
         """Start the WebSocket server in a background thread."""
@@ -81,18 +123,12 @@ class StateBroadcaster:
             return
 
         self._running = True
+        self._ready.clear()
         self._thread = threading.Thread(target=self._run_server, daemon=True)
         self._thread.start()
 
         # Wait for server to start
-        timeout = 5.0
-        start_time = datetime.now()
-        while self._loop is None and (datetime.now() - start_time).total_seconds() < timeout:
-            import time
-
-            time.sleep(0.01)
-
-        if self._loop is None:
+        if not self._ready.wait(timeout=5.0) or self._loop is None:
             self._running = False
             raise RuntimeError("Failed to start WebSocket server")
 
@@ -105,30 +141,18 @@ class StateBroadcaster:
 
         self._running = False
 
-        # Close all client connections
-        if self._loop and self._clients:
-            future = asyncio.run_coroutine_threadsafe(self._close_all_clients(), self._loop)
-            try:
-                future.result(timeout=2.0)
-            except Exception as e:
-                logger.warning(f"Error closing clients: {e}")
-
-        # Stop the server and wait for it to fully close
-        if self._server and self._loop:
-            self._server.close()
-            # Wait for the server to finish its async close tasks
-            future = asyncio.run_coroutine_threadsafe(
-                self._server.wait_closed(),
-                self._loop,
-            )
+        # Close clients and the server in one handoff to the server thread
+        if self._loop:
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
             try:
                 future.result(timeout=2.0)
             except Exception as e:
-                logger.warning(f"Error waiting for server close: {e}")
+                logger.warning(f"Error shutting down server: {e}")
 
-        # Stop the event loop
-        if self._loop:
-            self._loop.call_soon_threadsafe(self._loop.stop)
+            # Stop the event loop (once the server has closed, _run_server exits and
+            # closes the loop on its own)
+            with contextlib.suppress(RuntimeError):
+                self._loop.call_soon_threadsafe(self._loop.stop)
 
         # Wait for thread to finish
         if self._thread:
@@ -138,6 +162,10 @@ class StateBroadcaster:
         self._loop = None
         self._thread = None
         self._clients.clear()
+        self._drain_task = None
+        with self._lock:
+            self._pending_changes.clear()
+            self._drain_scheduled = False
 
         logger.info("StateBroadcaster stopped")
 
@@ -163,7 +191,7 @@ class StateBroadcaster:
         from padbound.debug.messages import FullStateMessage
 
         # Use model_construct() to skip re-validation - nested models are already valid
-        self._cached_full_state = FullStateMessage.model_construct(
+        message = FullStateMessage.model_construct(
             type="full_state",
             timestamp=datetime.now(),
             plugin_name=plugin_name,
@@ -171,31 +199,94 @@ class StateBroadcaster:
             states=states,
             definitions=definitions,
         )
+        # Serialize once; every new client is sent the same JSON
+        self._cached_full_state_json = message.model_dump_json()
+
+    def set_full_state_provider(self, provider: FullStateProvider) -> None:
+        """
+        Register a callable that builds the full controller state on demand.
+
+        The provider is invoked when the first client connects and its
+        result is cached for later clients, so no snapshot is built when
+        nobody is debugging.
+
+        Args:
+            provider: Callable returning (plugin_name, layout, states, definitions)
+        """
+        self._full_state_provider = provider
+        self._cached_full_state_json = None
+
+    def invalidate_full_state(self) -> None:
+        """Drop the cached full state so the provider is invoked again on the next client."""
+        if self._full_state_provider is not None:
+            self._cached_full_state_json = None
+
+    def _get_full_state_json(self) -> Optional[str]:
+        """Return the serialized full state, building it from the provider if needed."""
+        if self._cached_full_state_json is None and self._full_state_provider is not None:
+            plugin_name, layout, states, definitions = self._full_state_provider()
+            self.set_full_state(plugin_name=plugin_name, layout=layout, states=states, definitions=definitions)
+        return self._cached_full_state_json
 
     def broadcast_state_change(self, control_id: str, state: "ControlState") -> None:
         """
         Broadcast a state change to all connected clients.
 
         This method is thread-safe and can be called from the main thread.
+        It only records the change; the server thread sends the latest state
+        of all changed controls at most BROADCAST_INTERVAL later, so fast
+        fader/knob movement collapses into one message per frame.
 
         Args:
             control_id: ID of the control that changed
             state: New state of the control
         """
-        if not self._running or not self._loop:
+        loop = self._loop
+        if not self._running or not loop or not self._clients:
             return
 
-        from padbound.debug.messages import StateChangeMessage
+        with self._lock:
+            self._pending_changes[control_id] = state
+            # Wake the server thread once per frame rather than once per change
+            if self._drain_scheduled:
+                return
+            self._drain_scheduled = True
+        loop.call_soon_threadsafe(self._start_drain)
+
+    def _start_drain(self) -> None:
+        """Start draining queued state changes (runs on the server thread)."""
+        if self._loop:
+            self._drain_task = self._loop.create_task(self._drain_pending_changes())
 
-        # Use model_construct() to skip re-validation - state is already valid
-        message = StateChangeMessage.model_construct(
-            type="state_change",
-            timestamp=datetime.now(),
-            control_id=control_id,
-            state=state,
-        )
+    async def _drain_pending_changes(self) -> None:
+        """Broadcast the changes collected during one frame (runs on the server thread)."""
+        from padbound.debug.messages import StateChangesMessage
+
+        # Let changes accumulate for one frame before sending
+        await asyncio.sleep(self.BROADCAST_INTERVAL)
+
+        with self._lock:
+            states = self._pending_changes
+            self._pending_changes = {}
+            self._drain_scheduled = False
+
+        if not states:
+            return
 
-        asyncio.run_coroutine_threadsafe(self._broadcast(message.model_dump_json()), self._loop)
+        if orjson is not None:
+            # Same wire format as StateChangesMessage
+            payload = orjson.dumps(
+                {"type": "state_changes", "timestamp": datetime.now(), "states": states},
+                default=_model_fields,
+            ).decode()
+        else:
+            # Use model_construct() to skip re-validation - states are already valid
+            payload = StateChangesMessage.model_construct(
+                type="state_changes",
+                timestamp=datetime.now(),
+                states=states,
+            ).model_dump_json()
+        self._broadcast(payload)
 
     def _run_server(self) -> None:
         """Run the WebSocket server in the background thread."""
@@ -210,6 +301,7 @@ class StateBroadcaster:
                 self._host,
                 self._port,
             )
+            self._ready.set()
             await self._server.wait_closed()
 
         try:
@@ -218,6 +310,7 @@ class StateBroadcaster:
             if self._running:  # Only log if not intentionally stopped
                 logger.error(f"WebSocket server error: {e}")
         finally:
+            self._ready.set()  # Don't leave start() waiting if serving failed
             self._loop.close()
 
     async def _handle_client(self, websocket: "ServerConnection") -> None:
@@ -227,15 +320,18 @@ class StateBroadcaster:
         Args:
             websocket: The WebSocket connection
         """
-        with self._lock:
-            self._clients.add(websocket)
+        self._clients.add(websocket)
 
         logger.debug(f"Debug client connected from {websocket.remote_address}")
 
         try:
-            # Send cached full state to new client
-            if self._cached_full_state:
-                await websocket.send(self._cached_full_state.model_dump_json())
+            # Send cached full state to new client. Building it (first client after a
+            # change) serializes every definition, so keep that off the event loop.
+            full_state_json = self._cached_full_state_json
+            if full_state_json is None:
+                full_state_json = await asyncio.to_thread(self._get_full_state_json)
+            if full_state_json:
+                await websocket.send(full_state_json)
 
             # Keep connection open and handle incoming messages
             async for message in websocket:
@@ -246,42 +342,41 @@ class StateBroadcaster:
         except Exception as e:
             logger.debug(f"Client disconnected: {e}")
         finally:
-            with self._lock:
-                self._clients.discard(websocket)
+            self._clients.discard(websocket)
             logger.debug(f"Debug client disconnected from {websocket.remote_address}")
 
-    async def _broadcast(self, message: str) -> None:
+    def _broadcast(self, message: str) -> None:
         """
         Broadcast a message to all connected clients.
 
+        The frame is encoded once and written to every open connection without
+        waiting on any of them. Closed connections are skipped and removed by
+        _handle_client when their receive loop ends.
+
         Args:
             message: JSON-encoded message to broadcast
         """
-        with self._lock:
-            clients = self._clients.copy()
-
-        if not clients:
+        if not self._clients:
             return
 
-        # Send to all clients, removing any that fail
-        failed_clients = []
-        for client in clients:
-            try:
-                await client.send(message)
-            except Exception:
-                failed_clients.append(client)
+        from websockets.asyncio.server import broadcast
 
-        # Clean up failed clients
-        if failed_clients:
-            with self._lock:
-                for client in failed_clients:
-                    self._clients.discard(client)
+        broadcast(self._clients, message)
 
     async def _close_all_clients(self) -> None:
         """Close all client connections."""
-        with self._lock:
-            clients = self._clients.copy()
-
-        for client in clients:
-            with contextlib.suppress(Exception):
-                await client.close()
+        await asyncio.gather(*(client.close() for client in tuple(self._clients)), return_exceptions=True)
+
+    async def _shutdown(self) -> None:
+        """Close all clients, then stop the server and wait for it to close (runs on the server thread)."""
+        # Cancel a pending drain so it is not destroyed with the loop
+        drain_task = self._drain_task
+        self._drain_task = None
+        if drain_task is not None and not drain_task.done():
+            drain_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await drain_task
+        await self._close_all_clients()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
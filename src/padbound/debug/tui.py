@@ -8,6 +8,7 @@ with debug_server enabled.
 
 import argparse
 import asyncio
+from functools import cache, lru_cache
 from typing import Optional
 
 from pydantic import TypeAdapter
@@ -20,7 +21,7 @@ from textual.widgets import Footer, Header, Label, Static
 
 from padbound.controls import ControlDefinition, ControlState
 from padbound.debug.layout import ControlWidget, DebugLayout, LayoutSection
-from padbound.debug.messages import DebugMessage, FullStateMessage, StateChangeMessage
+from padbound.debug.messages import DebugMessage, FullStateMessage, StateChangeMessage, StateChangesMessage
 from padbound.logging_config import get_logger
 from padbound.utils import RGBColor
 
@@ -34,6 +35,17 @@ BUTTON_HEIGHT = 2
 FADER_WIDTH = 5
 FADER_HEIGHT = 14  # Tall vertical fader (includes border)
 INDEX_LABEL_WIDTH = 3  # Width for row/column index labels
+VALUE_REFRESH_INTERVAL = 1 / 30  # Max redraw period for fader/knob values (seconds)
+
+# Validator for incoming messages, built once (building it compiles the discriminated union)
+_MSG_ADAPTER: TypeAdapter[DebugMessage] = TypeAdapter(DebugMessage)
+
+
+@lru_cache(maxsize=256)
+def _color_to_hex(color: str) -> str:
+    """Convert a color string to a CSS hex color (pads cycle through a small palette)."""
+    rgb = RGBColor.from_string(color)
+    return f"#{rgb.r:02x}{rgb.g:02x}{rgb.b:02x}"
 
 
 class PadWidget(Static):
@@ -46,17 +58,18 @@ class PadWidget(Static):
         super().__init__(**kwargs)
         self.control_id = control_id
 
-    def compose(self) -> ComposeResult:
         # control_id format: pad_{physical_row}_{col}
         # Compute linear index: physical_row * 8 + col (0 = bottom-left)
-        parts = self.control_id.split("_")
+        parts = control_id.split("_")
         if len(parts) == 3 and parts[0] == "pad":
             physical_row = int(parts[1])
             col = int(parts[2])
-            linear_index = physical_row * 8 + col
-            yield Label(str(linear_index), id="pad-label")
+            self._pad_label = str(physical_row * 8 + col)
         else:
-            yield Label(self.control_id.split("_")[-1], id="pad-label")
+            self._pad_label = parts[-1]
+
+    def compose(self) -> ComposeResult:
+        yield Label(self._pad_label, id="pad-label")
 
     def watch_is_on(self, value: bool) -> None:
         self._update_style()
@@ -81,13 +94,18 @@ class PadWidget(Static):
         """
         # Use padbound's RGBColor for consistent color parsing
         try:
-            rgb = RGBColor.from_string(color)
-            return f"#{rgb.r:02x}{rgb.g:02x}{rgb.b:02x}"
+            return _color_to_hex(color)
         except Exception:
             # Fallback to gray if parsing fails
             return "#888888"
 
 
+@cache
+def _fader_bar_strings(bar_height: int) -> tuple[str, ...]:
+    """Rendered vertical bars for every fill level 0..bar_height (filled rows at the bottom)."""
+    return tuple("\n".join(["░░░░"] * (bar_height - filled) + ["████"] * filled) for filled in range(bar_height + 1))
+
+
 class FaderWidget(Static):
     """Widget representing a fader/slider control as a vertical bar."""
 
@@ -98,6 +116,9 @@ class FaderWidget(Static):
         self.control_id = control_id
         self.label_text = label or control_id
         self._bar_height = FADER_HEIGHT - 4  # Minus border (2), label (1), and value (1)
+        self._bar_strings = _fader_bar_strings(self._bar_height)
+        self._filled_rows: Optional[int] = None  # Fill level currently shown
+        self._refresh_pending = False
 
     def compose(self) -> ComposeResult:
         yield Label(self.label_text, id="fader-label")
@@ -105,6 +126,13 @@ class FaderWidget(Static):
         yield Label("0", id="fader-value")
 
     def watch_value(self, new_value: int) -> None:
+        # Redraw at most every VALUE_REFRESH_INTERVAL, showing the latest value
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.set_timer(VALUE_REFRESH_INTERVAL, self._refresh_value)
+
+    def _refresh_value(self) -> None:
+        self._refresh_pending = False
         self._update_bar()
 
     def on_mount(self) -> None:
@@ -120,18 +148,12 @@ class FaderWidget(Static):
 
             # Calculate filled portion (value 0-127)
             fill_ratio = self.value / 127.0
-            filled_rows = int(fill_ratio * self._bar_height)
-
-            # Build vertical bar from bottom to top
-            # Use block characters for the bar
-            lines = []
-            for i in range(self._bar_height):
-                row_from_bottom = self._bar_height - 1 - i
-                if row_from_bottom < filled_rows:
-                    lines.append("████")  # Filled
-                else:
-                    lines.append("░░░░")  # Empty
-            bar.update("\n".join(lines))
+            filled_rows = min(max(int(fill_ratio * self._bar_height), 0), self._bar_height)
+
+            # The bar only changes when the fill level does
+            if filled_rows != self._filled_rows:
+                bar.update(self._bar_strings[filled_rows])
+                self._filled_rows = filled_rows
         except Exception:
             pass  # Widget not mounted yet
 
@@ -165,15 +187,23 @@ class KnobWidget(Static):
         super().__init__(**kwargs)
         self.control_id = control_id
         self.label_text = label or control_id
+        self._refresh_pending = False
 
     def compose(self) -> ComposeResult:
         yield Label(self.label_text, id="knob-label")
         yield Label("64", id="knob-value")
 
     def watch_value(self, new_value: int) -> None:
+        # Redraw at most every VALUE_REFRESH_INTERVAL, showing the latest value
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.set_timer(VALUE_REFRESH_INTERVAL, self._refresh_value)
+
+    def _refresh_value(self) -> None:
+        self._refresh_pending = False
         try:
             value_label = self.query_one("#knob-value", Label)
-            value_label.update(str(new_value))
+            value_label.update(str(self.value))
         except Exception:
             pass
 
@@ -403,8 +433,7 @@ class ControllerStateApp(App):
     async def _process_message(self, message: str) -> None:
         """Process incoming WebSocket message."""
         # Parse message using discriminated union
-        msg_adapter: TypeAdapter[DebugMessage] = TypeAdapter(DebugMessage)
-        msg = msg_adapter.validate_json(message)
+        msg = _MSG_ADAPTER.validate_json(message)
 
         if isinstance(msg, FullStateMessage):
             # Initial state with layout
@@ -427,7 +456,9 @@ class ControllerStateApp(App):
                     self.notify(f"Sample pad definition off_color: {sample_def.off_color}")
 
             if msg.layout:
-                await self._build_layout(msg.layout)
+                # Keep the existing widgets when the layout is unchanged (e.g. on reconnect)
+                if msg.layout != self._layout:
+                    await self._build_layout(msg.layout)
             else:
                 self.notify("No layout in full_state message!", severity="warning")
 
@@ -442,6 +473,11 @@ class ControllerStateApp(App):
             # Single control update
             await self._update_control(msg.control_id, msg.state)
 
+        elif isinstance(msg, StateChangesMessage):
+            # Coalesced updates (latest state per control)
+            for control_id, state in msg.states.items():
+                await self._update_control(control_id, state)
+
     async def _build_layout(self, layout: DebugLayout) -> None:
         """Build TUI layout from plugin definition."""
         self._layout = layout
@@ -450,18 +486,21 @@ class ControllerStateApp(App):
         sections_container = self.query_one("#sections", ScrollableContainer)
         await sections_container.remove_children()
 
-        # Build each section
+        # Build each section, then mount them together so the layout is computed once
+        section_widgets = []
         for section in self._layout.sections:
             self.notify(f"Building section: {section.name} ({len(section.controls)} controls)")
             try:
-                section_widget = await self._build_section(section)
-                await sections_container.mount(section_widget)
+                section_widgets.append(await self._build_section(section))
             except Exception as e:
                 import traceback
 
                 self.notify(f"Error building {section.name}: {e}", severity="error")
                 logger.error(f"Error building section {section.name}: {traceback.format_exc()}")
 
+        if section_widgets:
+            await sections_container.mount_all(section_widgets)
+
         self.notify(f"Layout complete: {len(self._widgets)} widgets")
         self.refresh()
 
@@ -566,25 +605,35 @@ class ControllerStateApp(App):
         if not widget:
             return
 
+        # Unchanged controls return early: no reactive writes and no repaint.
+        # Changed reactives restyle/redraw the widget through their watchers.
         if isinstance(widget, PadWidget):
+            is_on = state.is_on if state.is_on is not None else False
+            if widget.is_on == is_on and widget.color == state.color:
+                return
             log(state)
-            widget.is_on = state.is_on if state.is_on is not None else False
+            widget.is_on = is_on
 
             # Get colors from state
             widget.color = state.color
-
-            widget._update_style()
             log(widget.color)
 
         elif isinstance(widget, FaderWidget):
             # Handle None value explicitly (fader not yet moved)
-            widget.value = state.value if state.value is not None else 0
+            value = state.value if state.value is not None else 0
+            if widget.value == value:
+                return
+            widget.value = value
         elif isinstance(widget, ButtonWidget):
-            widget.is_on = state.is_on if state.is_on is not None else False
+            is_on = state.is_on if state.is_on is not None else False
+            if widget.is_on == is_on:
+                return
+            widget.is_on = is_on
         elif isinstance(widget, KnobWidget):
-            widget.value = state.value if state.value is not None else 64
-
-        widget.update()
+            value = state.value if state.value is not None else 64
+            if widget.value == value:
+                return
+            widget.value = value
 
     def action_reconnect(self) -> None:
         """Reconnect to WebSocket server."""
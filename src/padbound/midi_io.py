@@ -8,7 +8,7 @@ input processing using a background thread.
 import queue
 import threading
 import time
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 import mido
 
@@ -16,6 +16,10 @@ from padbound.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Gaps shorter than this are busy-waited instead of slept, since sleep() can
+# overshoot by a scheduler tick and add jitter to sub-millisecond pacing
+_SPIN_THRESHOLD = 0.001
+
 
 class MIDIInterface:
     """
@@ -45,8 +49,10 @@ class MIDIInterface:
         self._input_thread: Optional[threading.Thread] = None
         self._message_queue: queue.Queue = queue.Queue(maxsize=1000)
 
-        # Thread-safe port access
-        self._port_lock = threading.Lock()
+        # Thread-safe port access: separate locks so output sends (e.g. LED
+        # feedback bursts) never stall the input thread, and vice versa
+        self._port_lock = threading.Lock()  # Output port
+        self._input_lock = threading.Lock()  # Input port
 
         # Statistics
         self._dropped_messages = 0
@@ -55,7 +61,7 @@ class MIDIInterface:
     @property
     def is_connected(self) -> bool:
         """Check if MIDI ports are connected."""
-        with self._port_lock:
+        with self._input_lock, self._port_lock:
             return self._input_port is not None or self._output_port is not None
 
     @property
@@ -84,7 +90,7 @@ class MIDIInterface:
             raise ValueError("At least one port (input or output) must be specified")
 
         # Open ports
-        with self._port_lock:
+        with self._input_lock, self._port_lock:
             try:
                 if input_port_name:
                     self._input_port = mido.open_input(input_port_name)
@@ -127,7 +133,7 @@ class MIDIInterface:
             self._input_thread = None
 
         # Close ports
-        with self._port_lock:
+        with self._input_lock, self._port_lock:
             if self._input_port:
                 try:
                     self._input_port.close()
@@ -163,7 +169,7 @@ class MIDIInterface:
 
         while self._running.is_set():
             try:
-                with self._port_lock:
+                with self._input_lock:
                     if not self._input_port:
                         break
 
@@ -198,7 +204,7 @@ class MIDIInterface:
         while True:
             try:
                 msg = self._message_queue.get_nowait()
-                logger.debug(f"Received MIDI message: {msg}")
+                logger.debug("Received MIDI message: %s", msg)
                 self._on_message(msg)
                 self._processed_messages += 1
                 count += 1
@@ -237,6 +243,86 @@ class MIDIInterface:
                 logger.error(f"Error sending MIDI message: {e}")
                 return False
 
+    def send_messages(self, messages: Iterable[mido.Message], chunk_size: int = 64) -> int:
+        """
+        Send multiple MIDI messages back-to-back (thread-safe).
+
+        The port lock is taken once per chunk rather than once per message,
+        and released between chunks so large batches don't stall input.
+
+        Args:
+            messages: MIDI messages to send, in order
+            chunk_size: Maximum number of messages written per lock acquisition
+
+        Returns:
+            Number of messages sent successfully
+        """
+        pending = messages if isinstance(messages, list) else list(messages)
+        sent = 0
+
+        for start in range(0, len(pending), chunk_size):
+            with self._port_lock:
+                if not self._output_port:
+                    logger.warning("Cannot send messages: no output port connected")
+                    return sent
+
+                port_send = self._output_port.send
+                for msg in pending[start : start + chunk_size]:
+                    try:
+                        port_send(msg)
+                        sent += 1
+                    except Exception as e:
+                        logger.error(f"Error sending MIDI message: {e}")
+
+        return sent
+
+    def send_with_delays(
+        self,
+        messages: list[mido.Message],
+        delays: Optional[list[float]] = None,
+        default_delay: float = 0.0,
+    ) -> int:
+        """
+        Send MIDI messages with a minimum delay after each one (thread-safe).
+
+        Without any delay, messages are sent in bulk via send_messages().
+        Otherwise each gap is measured from the start of the previous send
+        against a monotonic clock, so time spent sending counts toward the
+        delay and only the remainder is waited. Sub-millisecond remainders
+        are busy-waited; longer ones are slept. The port lock is not held
+        while waiting.
+
+        Args:
+            messages: MIDI messages to send, in order
+            delays: Optional per-message delays (seconds after each message);
+                missing entries fall back to default_delay
+            default_delay: Delay used when delays is None or too short
+
+        Returns:
+            Number of messages sent successfully
+        """
+        if delays is None and default_delay <= 0:
+            return self.send_messages(messages)
+
+        send = self.send_message
+        clock = time.perf_counter
+        sleep = time.sleep
+        num_delays = len(delays) if delays is not None else 0
+        sent = 0
+        for i, msg in enumerate(messages):
+            sent_at = clock()
+            if send(msg):
+                sent += 1
+            deadline = sent_at + (delays[i] if i < num_delays else default_delay)
+            remaining = deadline - clock()
+            if remaining >= _SPIN_THRESHOLD:
+                sleep(remaining)
+            else:
+                while clock() < deadline:
+                    pass
+
+        return sent
+
     def receive_message(self, timeout: float = 0.5) -> Optional[mido.Message]:
         """
         Receive a single MIDI message with timeout.
@@ -252,7 +338,7 @@ class MIDIInterface:
         """
         try:
             msg = self._message_queue.get(block=True, timeout=timeout)
-            logger.debug(f"Received MIDI message (sync): {msg}")
+            logger.debug("Received MIDI message (sync): %s", msg)
             return msg
         except queue.Empty:
             return None
@@ -20,7 +20,7 @@ from padbound.controls import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchFeedbackResult:
     """Result from translate_feedback_batch with optional timing control.
 
@@ -530,6 +530,10 @@ class ControllerPlugin(ABC):
 
         Default implementation uses feedback mappings. Override for complex logic.
 
+        The Controller may reuse the same state_dict object across calls (e.g., for
+        auto-feedback on every MIDI event), so implementations must only read it
+        during the call and copy anything they need to keep.
+
         Args:
             control_id: Control identifier
             state_dict: State dictionary (is_on, value, color, etc.)
@@ -225,7 +225,6 @@ References:
 
 import colorsys
 import time
-from datetime import datetime
 from typing import Callable, Optional, Tuple
 
 import mido
@@ -740,9 +739,9 @@ class AkaiAPCminiMK2Plugin(ControllerPlugin):
                             supports_color=True,
                             color_mode="rgb",  # True RGB via SysEx (solid mode)
                             supported_led_modes=[
-                                LEDMode(animation_type=LEDAnimationType.SOLID),
-                                LEDMode(animation_type=LEDAnimationType.PULSE),
-                                LEDMode(animation_type=LEDAnimationType.BLINK),
+                                LEDMode.get(LEDAnimationType.SOLID),
+                                LEDMode.get(LEDAnimationType.PULSE),
+                                LEDMode.get(LEDAnimationType.BLINK),
                             ],  # Pulse/blink use palette
                             requires_discovery=False,  # Pads report state immediately
                         ),
@@ -1430,7 +1429,6 @@ class AkaiAPCminiMK2Plugin(ControllerPlugin):
                 return (
                     ControlState(
                         control_id=control_id,
-                        timestamp=datetime.now(),
                         is_discovered=True,
                         is_on=on_state,
                         value=value,
@@ -1450,7 +1448,6 @@ class AkaiAPCminiMK2Plugin(ControllerPlugin):
                     return (
                         ControlState(
                             control_id=control_id,
-                            timestamp=datetime.now(),
                             is_discovered=True,
                             is_on=on_state,
                             value=value,
@@ -326,9 +326,9 @@ class PreSonusAtomPlugin(ControllerPlugin):
                         supports_color=True,
                         color_mode="rgb",
                         supported_led_modes=[
-                            LEDMode(animation_type=LEDAnimationType.SOLID),
-                            LEDMode(animation_type=LEDAnimationType.PULSE),
-                            LEDMode(animation_type=LEDAnimationType.BLINK),
+                            LEDMode.get(LEDAnimationType.SOLID),
+                            LEDMode.get(LEDAnimationType.PULSE),
+                            LEDMode.get(LEDAnimationType.BLINK),
                         ],
                         requires_discovery=False,
                     ),
@@ -991,8 +991,6 @@ class XjamPlugin(ControllerPlugin):
             ControlState for pads (hardware manages toggle state),
             None for other controls (use default behavior).
         """
-        from datetime import datetime
-
         from padbound.controls import ControlState, ControlType
 
         # Only handle pads with toggle type
@@ -1014,7 +1012,6 @@ class XjamPlugin(ControllerPlugin):
         return (
             ControlState(
                 control_id=control_id,
-                timestamp=datetime.now(),
                 is_discovered=True,
                 is_on=is_on,
                 value=value,
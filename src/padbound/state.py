@@ -6,8 +6,9 @@ bank management, and state history.
 """
 
 import threading
+import time
 from collections import deque
-from typing import Optional
+from typing import Iterable, Optional
 
 from padbound.controls import (
     Control,
@@ -17,6 +18,9 @@ from padbound.controls import (
     ControlType,
 )
 
+# State fields that set_states()-style partial updates may change
+_PARTIAL_UPDATE_FIELDS = ("value", "is_on", "color", "led_mode")
+
 
 class BankState:
     """
@@ -27,6 +31,8 @@ class BankState:
     unavailable even if the controller has banks.
     """
 
+    __slots__ = ("_supports_feedback", "_active_banks", "_lock")
+
     def __init__(self, supports_bank_feedback: bool):
         """
         Initialize bank state.
@@ -98,6 +104,7 @@ class ControllerState:
         """
         self._capabilities = capabilities
         self._controls: dict[str, Control] = {}
+        self._discovered: set[str] = set()  # IDs of controls with known state
         self._bank_state = BankState(capabilities.supports_bank_feedback)
         self._lock = threading.RLock()
 
@@ -109,6 +116,11 @@ class ControllerState:
         """Get controller capabilities."""
         return self._capabilities
 
+    @property
+    def discovered_count(self) -> int:
+        """Number of controls that have been discovered."""
+        return len(self._discovered)
+
     def register_control(self, control: Control) -> None:
         """
         Register a control (called during initialization).
@@ -119,6 +131,17 @@ class ControllerState:
         with self._lock:
             self._controls[control.definition.control_id] = control
 
+    def register_controls(self, controls: Iterable[Control]) -> None:
+        """
+        Register multiple controls under a single lock acquisition.
+
+        Args:
+            controls: Control instances to register
+        """
+        entries = {control.definition.control_id: control for control in controls}
+        with self._lock:
+            self._controls.update(entries)
+
     def get_control(self, control_id: str) -> Optional[Control]:
         """
         Get control by ID.
@@ -129,8 +152,9 @@ class ControllerState:
         Returns:
             Control instance or None if not found
         """
-        with self._lock:
-            return self._controls.get(control_id)
+        # Lock-free: controls are only ever added to this dict (never replaced),
+        # and a single dict lookup is atomic
+        return self._controls.get(control_id)
 
     def update_state(self, control_id: str, value: int, **kwargs) -> ControlState:
         """
@@ -154,6 +178,7 @@ class ControllerState:
 
             # Update control state
             new_state = control.update_from_midi(value, **kwargs)
+            self._discovered.add(control_id)
 
             # Track in history
             self._history.append((control_id, new_state))
@@ -188,12 +213,54 @@ class ControllerState:
 
             # Update control's internal state directly
             control._state = new_state
+            if new_state.is_discovered:
+                self._discovered.add(control_id)
+            else:
+                self._discovered.discard(control_id)
 
             # Track in history
             self._history.append((control_id, new_state))
 
             return new_state
 
+    def apply_partial_updates(self, updates: list[tuple[str, dict]]) -> None:
+        """
+        Apply partial state updates to many controls under a single lock acquisition.
+
+        Only the value, is_on, color and led_mode keys present in each update
+        are applied; other fields (discovery, normalized value) are preserved.
+        Unknown control IDs are skipped. All new states are validated before
+        any is stored, so an invalid update leaves every control unchanged.
+
+        Args:
+            updates: List of (control_id, state_dict) tuples
+
+        Raises:
+            pydantic.ValidationError: If an update holds an invalid value
+        """
+        now = time.time_ns()
+        fields = _PARTIAL_UPDATE_FIELDS
+        validate = ControlState.model_validate
+        with self._lock:
+            get_control = self._controls.get
+            new_states: list[tuple[str, Control, ControlState]] = []
+            for control_id, state_dict in updates:
+                control = get_control(control_id)
+                if not control:
+                    continue
+
+                # Only keys present in the update change; the rest keep their current values
+                changes = {key: state_dict[key] for key in fields if key in state_dict}
+                changes["timestamp_ns"] = now
+                new_states.append((control_id, control, validate({**control._state.__dict__, **changes})))
+
+            record = self._history.append
+            for control_id, control, new_state in new_states:
+                control._state = new_state
+
+                # Track in history
+                record((control_id, new_state))
+
     def get_state(self, control_id: str) -> Optional[ControlState]:
         """
         Get current state for a control.
@@ -236,7 +303,8 @@ class ControllerState:
             List of control IDs with known state
         """
         with self._lock:
-            return [control_id for control_id, control in self._controls.items() if control.state.is_discovered]
+            discovered = self._discovered
+            return [control_id for control_id in self._controls if control_id in discovered]
 
     def get_undiscovered_controls(self) -> list[str]:
         """
@@ -246,7 +314,8 @@ class ControllerState:
             List of control IDs with unknown state
         """
         with self._lock:
-            return [control_id for control_id, control in self._controls.items() if not control.state.is_discovered]
+            discovered = self._discovered
+            return [control_id for control_id in self._controls if control_id not in discovered]
 
     def get_controls_by_type(self, control_type: ControlType) -> list[str]:
         """
@@ -392,7 +461,8 @@ class ControllerState:
             if not capabilities.supports_color:
                 return False
 
-            palette = capabilities.color_palette
+            # Palette is cached as a frozenset on the control
+            palette = control._palette_set
             if palette is None:
                 # No palette defined, accept any color
                 return True